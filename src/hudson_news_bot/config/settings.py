@@ -1,14 +1,13 @@
 """Configuration management for the news aggregation bot."""
 
-import copy
 import os
 import sys
-from functools import cached_property
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Final, NotRequired, TypedDict, cast
 
-from hudson_news_bot.utils.toml_handler import TOMLHandler
-
 
 class NewsConfig(TypedDict):
     """Configuration for news aggregation."""
@@ -17,6 +16,7 @@ class NewsConfig(TypedDict):
     news_sites: list[str]
     skip_recently_scraped: bool
     scraping_cache_hours: int
+    max_concurrent_fetches: NotRequired[int]
 
 
 class RedditConfig(TypedDict):
@@ -35,6 +35,8 @@ class LLMConfig(TypedDict):
     max_tokens: int
     timeout_seconds: int
     base_url: NotRequired[str]
+    batch_size: NotRequired[int]
+    max_concurrency: NotRequired[int]
 
 
 class DatabaseConfig(TypedDict):
@@ -52,40 +54,178 @@ class ConfigDict(TypedDict):
     database: DatabaseConfig
 
 
-DEFAULT_CONFIG: Final[ConfigDict] = {
-    "news": {
-        "max_articles": 5,
-        "news_sites": [
-            "https://www.beaconjournal.com/communities/hudsonhubtimes/",
-            "https://fox8.com/tag/hudson-news/",
-            "https://thesummiteer.org/posts",
-            "https://www.news5cleveland.com/news/local-news/oh-summit/",
-            "https://www.wkyc.com/section/summit-county",
-        ],
-        "skip_recently_scraped": True,
-        "scraping_cache_hours": 2160,  # 90 days
-    },
-    "reddit": {
-        "subreddit": "news",
-        "user_agent": "hudson-news-bot/0.1.0",
-        "check_for_duplicates": True,
-        "max_search_results": 100,
-    },
-    "llm": {
-        "model": "minimax-m2.5-free",
-        "max_tokens": 4096,
-        "timeout_seconds": 300,
-        "base_url": "https://opencode.ai/zen/v1",
-    },
-    "database": {"path": "data/submissions.db"},
-}
+PROJECT_ROOT: Final = Path(__file__).resolve().parents[3]
+DEFAULT_CONFIG_PATH: Final = PROJECT_ROOT / "config" / "config.toml"
+
+# Environment variables read by Config, snapshotted once per instance
+ENV_VARS: Final = (
+    "LLM_API_KEY",
+    "PERPLEXITY_API_KEY",
+    "PROMPTS_DIR",
+    "REDDIT_CLIENT_ID",
+    "REDDIT_CLIENT_SECRET",
+    "REDDIT_USERNAME",
+    "REDDIT_PASSWORD",
+)
+
+ConfigMapping = Mapping[str, Mapping[str, Any]]
+"""Read-only view of a configuration, as returned by ``_freeze_config``."""
+
+ValidationRule = tuple[str, Callable[[Any], bool], str]
+"""Config check as (attribute name, predicate, error message)."""
+
+
+def _freeze_config(config: ConfigDict) -> ConfigMapping:
+    """Make a configuration structurally immutable so it can be shared safely."""
+
+    def freeze(value: Any) -> Any:
+        if isinstance(value, dict):
+            items = cast(dict[str, Any], value).items()
+            return MappingProxyType({key: freeze(item) for key, item in items})
+        if isinstance(value, list):
+            return tuple(freeze(item) for item in value)
+        return value
+
+    frozen: ConfigMapping = freeze(config)
+    return frozen
+
+
+DEFAULT_CONFIG: Final[ConfigMapping] = _freeze_config(
+    {
+        "news": {
+            "max_articles": 5,
+            "news_sites": [
+                "https://www.beaconjournal.com/communities/hudsonhubtimes/",
+                "https://fox8.com/tag/hudson-news/",
+                "https://thesummiteer.org/posts",
+                "https://www.news5cleveland.com/news/local-news/oh-summit/",
+                "https://www.wkyc.com/section/summit-county",
+            ],
+            "skip_recently_scraped": True,
+            "scraping_cache_hours": 2160,  # 90 days
+            "max_concurrent_fetches": 4,
+        },
+        "reddit": {
+            "subreddit": "news",
+            "user_agent": "hudson-news-bot/0.1.0",
+            "check_for_duplicates": True,
+            "max_search_results": 100,
+        },
+        "llm": {
+            "model": "minimax-m2.5-free",
+            "max_tokens": 4096,
+            "timeout_seconds": 300,
+            "base_url": "https://opencode.ai/zen/v1",
+            "batch_size": 5,
+            "max_concurrency": 4,
+        },
+        "database": {"path": "data/submissions.db"},
+    }
+)
 
 
 class Config:
-    """Configuration management using TOML files and environment variables."""
+    """Configuration management using TOML files and environment variables.
+
+    Values from the TOML file are merged with ``DEFAULT_CONFIG`` and coerced
+    into plain attributes once, when the instance is created. Attributes are
+    read-only afterwards, because ``get_config`` shares one instance per
+    file across the process.
+
+    Attributes:
+        subreddit_name: Reddit subreddit name
+        max_articles: Maximum number of articles to aggregate
+        reddit_user_agent: Reddit API user agent
+        check_for_duplicates: Whether to check for duplicate submissions
+        max_search_results: Maximum search results for duplicate checking
+        llm_model: LLM model name
+        llm_max_tokens: Maximum tokens for LLM response
+        llm_timeout_seconds: LLM request timeout in seconds
+        llm_base_url: LLM API base URL
+        llm_batch_size: Articles analyzed per LLM request; requests run concurrently
+        llm_max_concurrency: Most LLM requests in flight at once
+        database_path: Database path
+        skip_recently_scraped: Whether to skip recently scraped URLs
+        scraping_cache_hours: Number of hours to cache scraped URLs
+        max_concurrent_fetches: Most pages the scraper loads at once
+        news_sites: List of news sites to scrape
+    """
+
+    __slots__ = (
+        "_config_exists",
+        "_config_path",
+        "_data",
+        "_env",
+        "_loaded",
+        "_prompts_dir",
+        "check_for_duplicates",
+        "database_path",
+        "llm_base_url",
+        "llm_batch_size",
+        "llm_max_concurrency",
+        "llm_max_tokens",
+        "llm_model",
+        "llm_timeout_seconds",
+        "max_articles",
+        "max_concurrent_fetches",
+        "max_search_results",
+        "news_sites",
+        "reddit_user_agent",
+        "scraping_cache_hours",
+        "skip_recently_scraped",
+        "subreddit_name",
+    )
+
+    # Environment variables that must be set for the bot to run
+    REQUIRED_ENV_VARS: Final = ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET")
+
+    # Checks run against the typed attributes set by _flatten
+    VALIDATION_RULES: Final[tuple[ValidationRule, ...]] = (
+        (
+            "max_articles",
+            lambda value: value > 0,
+            "max_articles must be greater than 0",
+        ),
+        (
+            "max_concurrent_fetches",
+            lambda value: value > 0,
+            "max_concurrent_fetches must be greater than 0",
+        ),
+        (
+            "llm_batch_size",
+            lambda value: value > 0,
+            "llm batch_size must be greater than 0",
+        ),
+        (
+            "llm_max_concurrency",
+            lambda value: value > 0,
+            "llm max_concurrency must be greater than 0",
+        ),
+    )
 
     _config_path: Final[Path]
-    _data: Final[ConfigDict]
+    _data: Final[ConfigMapping]
+    _env: Final[dict[str, str | None]]
+    _config_exists: bool
+    _loaded: bool
+    _prompts_dir: Path | None
+
+    subreddit_name: str
+    max_articles: int
+    reddit_user_agent: str
+    check_for_duplicates: bool
+    max_search_results: int
+    llm_model: str
+    llm_max_tokens: int
+    llm_timeout_seconds: int
+    llm_base_url: str
+    llm_batch_size: int
+    llm_max_concurrency: int
+    database_path: str
+    skip_recently_scraped: bool
+    scraping_cache_hours: int
+    max_concurrent_fetches: int
+    news_sites: list[str]
 
     def __init__(
         self,
@@ -97,88 +237,113 @@ class Config:
             config_path: Path to configuration file. Defaults to config/config.toml
         """
         if config_path is None:
-            # Default to config/config.toml relative to project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            config_path = project_root / "config" / "config.toml"
+            config_path = DEFAULT_CONFIG_PATH
 
         self._config_path = Path(config_path)
+        self._prompts_dir = None
+        environ = os.environ
+        self._env = {name: environ.get(name) for name in ENV_VARS}
         self._data = self._get_config_data(self._config_path)
+        self._flatten(self._data)
+        self._loaded = True
 
-    def _get_config_data(self, config_path: Path) -> ConfigDict:
-        """Load configuration data from the specified TOML file."""
-        data = TOMLHandler.load_config(config_path)
-        merged_data = deep_merge_dicts(cast(dict[str, Any], DEFAULT_CONFIG), data)
-        return cast(ConfigDict, merged_data)
-
-    @cached_property
-    def subreddit_name(self) -> str:
-        """Get Reddit subreddit name."""
-        return str(self._data.get("reddit", {}).get("subreddit", "news"))
-
-    @cached_property
-    def max_articles(self) -> int:
-        """Get maximum number of articles to aggregate."""
-        return int(self._data.get("news", {}).get("max_articles", 5))
-
-    @cached_property
-    def reddit_user_agent(self) -> str:
-        """Get Reddit API user agent."""
-        return str(
-            self._data.get("reddit", {}).get("user_agent", "hudson-news-bot/0.1.0")
-        )
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute while loading; reject changes once loaded."""
+        if getattr(self, "_loaded", False):
+            raise AttributeError(f"Config is read-only; cannot set {name!r}")
+        super().__setattr__(name, value)
 
-    @cached_property
-    def check_for_duplicates(self) -> bool:
-        """Whether to check for duplicate submissions."""
-        return bool(self._data.get("reddit", {}).get("check_for_duplicates", True))
-
-    @cached_property
-    def max_search_results(self) -> int:
-        """Maximum search results for duplicate checking."""
-        return int(self._data.get("reddit", {}).get("max_search_results", 100))
-
-    @cached_property
-    def llm_model(self) -> str:
-        """LLM model name."""
-        return str(self._data.get("llm", {}).get("model", "sonar-pro"))
-
-    @cached_property
-    def llm_max_tokens(self) -> int:
-        """Maximum tokens for LLM response."""
-        return int(self._data.get("llm", {}).get("max_tokens", 4096))
-
-    @cached_property
-    def llm_timeout_seconds(self) -> int:
-        """LLM request timeout in seconds."""
-        return int(self._data.get("llm", {}).get("timeout_seconds", 300))
-
-    @cached_property
-    def llm_base_url(self) -> str:
-        """LLM API base URL."""
-        return str(
-            self._data.get("llm", {}).get("base_url", "https://api.perplexity.ai")
-        )
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion; Config instances are shared."""
+        raise AttributeError(f"Config is read-only; cannot delete {name!r}")
 
-    @cached_property
-    def database_path(self) -> str:
-        """Get database path."""
-        return str(self._data.get("database", {}).get("path", "data/submissions.db"))
+    def _get_config_data(self, config_path: Path) -> ConfigMapping:
+        """Load configuration data from the specified TOML file."""
+        data = self._load_toml(config_path)
+        if not data:
+            # Nothing to override; Config never mutates _data so the defaults
+            # can be shared as-is.
+            return DEFAULT_CONFIG
+
+        # Only sections present in the file need merging, the others keep
+        # referencing the frozen default subtrees.
+        merged_data = dict(DEFAULT_CONFIG)
+        for key, value in data.items():
+            default = DEFAULT_CONFIG.get(key)
+            if isinstance(default, Mapping) and isinstance(value, dict):
+                merged_data[key] = deep_merge_dicts(default, value)
+            else:
+                merged_data[key] = value
+        return merged_data
+
+    def _flatten(self, data: ConfigMapping) -> None:
+        """Coerce the merged configuration into typed attributes in one pass.
 
-    @cached_property
-    def skip_recently_scraped(self) -> bool:
-        """Whether to skip recently scraped URLs."""
-        return bool(self._data.get("news", {}).get("skip_recently_scraped", True))
+        Args:
+            data: Merged configuration data
+        """
+        # Every DEFAULT_CONFIG key survives the merge, so index directly
+        news = data["news"]
+        reddit = data["reddit"]
+        llm = data["llm"]
+
+        # Short identifiers are interned so repeated comparisons are identity
+        # checks and repeated Config builds share one copy of each string.
+        self.subreddit_name = sys.intern(str(reddit["subreddit"]))
+        self.reddit_user_agent = sys.intern(str(reddit["user_agent"]))
+        self.llm_model = sys.intern(str(llm["model"]))
+
+        self.max_articles = int(news["max_articles"])
+        self.check_for_duplicates = bool(reddit["check_for_duplicates"])
+        self.max_search_results = int(reddit["max_search_results"])
+        self.llm_max_tokens = int(llm["max_tokens"])
+        self.llm_timeout_seconds = int(llm["timeout_seconds"])
+        self.llm_base_url = str(llm["base_url"])
+        self.llm_batch_size = int(llm["batch_size"])
+        self.llm_max_concurrency = int(llm["max_concurrency"])
+        self.database_path = str(data["database"]["path"])
+        self.skip_recently_scraped = bool(news["skip_recently_scraped"])
+        self.scraping_cache_hours = int(news["scraping_cache_hours"])
+        self.max_concurrent_fetches = int(news["max_concurrent_fetches"])
+        # Copy so callers cannot mutate the (possibly shared) default list
+        self.news_sites = list(news["news_sites"])
+
+    def _load_toml(self, config_path: Path) -> dict[str, Any]:
+        """Load the TOML file, recording whether it exists.
 
-    @cached_property
-    def scraping_cache_hours(self) -> int:
-        """Number of hours to cache scraped URLs."""
-        return int(self._data.get("news", {}).get("scraping_cache_hours", 24))
+        Args:
+            config_path: Path to the TOML configuration file
 
-    @cached_property
+        Returns:
+            Parsed TOML data, or an empty dict if the file does not exist
+        """
+        # Imported lazily: the TOML parser is only needed once a Config is
+        # built, not for importing this module.
+        import tomllib
+
+        try:
+            with open(config_path, "rb") as config_file:
+                data = tomllib.load(config_file)
+        except FileNotFoundError:
+            self._config_exists = False
+            return {}
+        self._config_exists = True
+        return data
+
+    @property
     def prompts_dir(self) -> Path:
         """Get prompts directory path."""
+        prompts_dir = self._prompts_dir
+        if prompts_dir is None:
+            prompts_dir = self._find_prompts_dir()
+            # Resolved lazily, so it bypasses the read-only __setattr__
+            object.__setattr__(self, "_prompts_dir", prompts_dir)
+        return prompts_dir
+
+    def _find_prompts_dir(self) -> Path:
+        """Locate the prompts directory."""
         # Check for environment variable first (useful for containers)
-        prompts_path = os.getenv("PROMPTS_DIR")
+        prompts_path = self._env["PROMPTS_DIR"]
         if prompts_path:
             return Path(prompts_path)
 
@@ -188,46 +353,38 @@ class Config:
             return container_path
 
         # Fall back to relative path for development
-        project_root = Path(__file__).parent.parent.parent.parent
-        return project_root / "config" / "prompts"
-
-    @cached_property
-    def news_sites(self) -> list[str]:
-        """Get list of news sites to scrape."""
-        default_sites: list[str] = []
-        sites: list[str] = self._data.get("news", {}).get("news_sites", default_sites)
-        return sites
+        return PROJECT_ROOT / "config" / "prompts"
 
-    @cached_property
+    @property
     def perplexity_api_key(self) -> str | None:
         """Get Perplexity API key from environment."""
-        return os.getenv("PERPLEXITY_API_KEY")
+        return self._env["PERPLEXITY_API_KEY"]
 
-    @cached_property
+    @property
     def llm_api_key(self) -> str | None:
         """Get LLM API key from environment (checks both new and old names)."""
         # Check new name first, fall back to old name for backward compatibility
-        return os.getenv("LLM_API_KEY") or os.getenv("PERPLEXITY_API_KEY")
+        return self._env["LLM_API_KEY"] or self._env["PERPLEXITY_API_KEY"]
 
-    @cached_property
+    @property
     def reddit_client_id(self) -> str | None:
         """Get Reddit client ID from environment."""
-        return os.getenv("REDDIT_CLIENT_ID")
+        return self._env["REDDIT_CLIENT_ID"]
 
-    @cached_property
+    @property
     def reddit_client_secret(self) -> str | None:
         """Get Reddit client secret from environment."""
-        return os.getenv("REDDIT_CLIENT_SECRET")
+        return self._env["REDDIT_CLIENT_SECRET"]
 
-    @cached_property
+    @property
     def reddit_username(self) -> str | None:
         """Get Reddit username from environment."""
-        return os.getenv("REDDIT_USERNAME")
+        return self._env["REDDIT_USERNAME"]
 
-    @cached_property
+    @property
     def reddit_password(self) -> str | None:
         """Get Reddit password from environment."""
-        return os.getenv("REDDIT_PASSWORD")
+        return self._env["REDDIT_PASSWORD"]
 
     def validate(self) -> tuple[bool, list[str]]:
         """Validate configuration and environment variables.
@@ -237,25 +394,53 @@ class Config:
         """
         errors: list[str] = []
 
-        # Check configuration file exists
-        if not self._config_path.exists():
+        # Check configuration file exists (recorded when it was loaded)
+        if not self._config_exists:
             errors.append(f"Configuration file not found: {self._config_path}")
 
         # Validate required Reddit credentials
-        if not self.reddit_client_id:
-            errors.append("REDDIT_CLIENT_ID environment variable is required")
-
-        if not self.reddit_client_secret:
-            errors.append("REDDIT_CLIENT_SECRET environment variable is required")
+        errors.extend(
+            f"{name} environment variable is required"
+            for name in self.REQUIRED_ENV_VARS
+            if not self._env[name]
+        )
 
         # Validate config values
-        if self.max_articles <= 0:
-            errors.append("max_articles must be greater than 0")
+        errors.extend(
+            message
+            for attribute, is_valid, message in self.VALIDATION_RULES
+            if not is_valid(getattr(self, attribute))
+        )
 
         return len(errors) == 0, errors
 
 
-def deep_merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
+def get_config(config_path: str | Path | None = None) -> Config:
+    """Get the shared Config instance for a configuration file.
+
+    Instances are cached per resolved path, so the TOML file is read and
+    merged once per process no matter how many callers ask for it.
+
+    Args:
+        config_path: Path to configuration file. Defaults to config/config.toml
+
+    Returns:
+        Cached Config instance
+    """
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+    return _get_cached_config(Path(config_path).resolve())
+
+
+@lru_cache(maxsize=4)
+def _get_cached_config(config_path: Path) -> Config:
+    """Build and memoize a Config for an already resolved path."""
+    return Config(config_path)
+
+
+def deep_merge_dicts(
+    dict1: Mapping[str, Any], dict2: Mapping[str, Any]
+) -> dict[str, Any]:
     """
     Recursively combine two dictionaries where dict2 overrides values in dict1 for common keys.
     For nested dictionaries, performs a deep merge rather than simple replacement.
@@ -267,17 +452,36 @@ def deep_merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str,
     Returns:
         dict: A new dictionary with the deeply combined key-value pairs
     """
+    result = {key: _clone(value) for key, value in dict1.items()}
+
+    # Walk nested sections with an explicit stack instead of recursing
+    stack: list[tuple[dict[str, Any], Mapping[str, Any]]] = [(result, dict2)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            current = target.get(key)
+            if isinstance(current, Mapping) and isinstance(value, Mapping):
+                # Both sides are sections: merge into a mutable copy of the base
+                if not isinstance(current, dict):
+                    current = target[key] = dict(cast(Mapping[str, Any], current))
+                stack.append((cast(dict[str, Any], current), value))
+            else:
+                # Otherwise just override/add the value
+                target[key] = _clone(value)
+    return result
 
-    result = copy.deepcopy(dict1)  # Create a deep copy to avoid modifying the original
 
-    for key, value in dict2.items():
-        # If both values are dictionaries, recursively merge them
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge_dicts(result[key], cast(dict[str, Any], value))
-        else:
-            # Otherwise just override/add the value
-            result[key] = copy.deepcopy(value)
-    return result
+def _clone(value: Any) -> Any:
+    """Copy the mutable containers found in parsed TOML data.
+
+    Dicts and lists are rebuilt so the result never shares them with its
+    source; scalars and frozen containers are immutable and returned as-is.
+    """
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in cast(dict[str, Any], value).items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
 
 
 def main() -> None:
@@ -293,16 +497,16 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.validate:
-        config = Config(args.config)
+        config = get_config(args.config)
         is_valid, errors = config.validate()
 
         if is_valid:
             print("✅ Configuration is valid")
             sys.exit(0)
         else:
-            print("❌ Configuration validation failed:")
-            for error in errors:
-                print(f"  - {error}")
+            lines = ["❌ Configuration validation failed:"]
+            lines.extend(f"  - {error}" for error in errors)
+            print("\n".join(lines))
             sys.exit(1)
     else:
         parser.print_help()
@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
+import re
 import sys
 from datetime import datetime, timedelta
-from typing import Any, List
+from functools import cached_property
+from typing import Any, Final
 
-from hudson_news_bot.config.settings import Config
+from hudson_news_bot.config.settings import Config, get_config
 from hudson_news_bot.news.aggregator import NewsAggregator
 from hudson_news_bot.news.models import NewsCollection, NewsItem
 from hudson_news_bot.reddit.client import RedditClient
@@ -14,6 +16,9 @@ from hudson_news_bot.reddit.deduplicator import DuplicationChecker
 from hudson_news_bot.utils.logging import setup_logging
 from hudson_news_bot.utils.toml_handler import TOMLHandler
 
+# Validation errors that can be ignored for dry runs
+REDDIT_CREDENTIAL_ERROR: Final = re.compile(r"REDDIT_CLIENT_(?:ID|SECRET)")
+
 
 class NewsBot:
     """Main orchestrator for news aggregation and Reddit posting."""
@@ -30,11 +35,16 @@ class NewsBot:
         # Initialize components
         self.reddit_client = RedditClient(config)
         self.news_aggregator = NewsAggregator(config, self.reddit_client)
-        self.deduplicator = DuplicationChecker(self.reddit_client, config)
+
+    @cached_property
+    def deduplicator(self) -> DuplicationChecker:
+        """Get the duplicate checker, creating its database on first use."""
+        return DuplicationChecker(self.reddit_client, self.config)
 
     async def cleanup(self) -> None:
         """Clean up resources."""
         await self.reddit_client.close()
+        await self.news_aggregator.close()
 
     async def run(self, dry_run: bool = False, output_file: str | None = None) -> bool:
         """Run the complete news aggregation and posting workflow.
@@ -58,94 +68,80 @@ class NewsBot:
                 non_reddit_errors = [
                     error
                     for error in errors
-                    if not any(
-                        reddit_term in error
-                        for reddit_term in ["REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET"]
-                    )
+                    if not REDDIT_CREDENTIAL_ERROR.search(error)
                 ]
                 if non_reddit_errors:
-                    self.logger.error("Configuration validation failed:")
-                    for error in non_reddit_errors:
-                        self.logger.error(f"  - {error}")
+                    self._log_validation_errors(non_reddit_errors)
                     return False
                 elif errors:
                     self.logger.info("Skipping Reddit validation for dry run")
             elif not is_valid:
-                self.logger.error("Configuration validation failed:")
-                for error in errors:
-                    self.logger.error(f"  - {error}")
+                self._log_validation_errors(errors)
                 return False
 
             # Step 2: Aggregate news
             self.logger.info("Aggregating news from LLM API...")
             news_collection = await self.news_aggregator.aggregate_news()
 
-            if not news_collection or len(news_collection) == 0:
+            aggregated_count = len(news_collection)
+            if aggregated_count == 0:
                 self.logger.warning("No news items were aggregated")
                 return False
 
-            self.logger.info(
-                f"Successfully aggregated {len(news_collection)} news items"
-            )
-
-            # Log breakdown of aggregated items
-            for idx, item in enumerate(news_collection, 1):
-                date_str = item.publication_date.strftime("%Y-%m-%d %H:%M:%S")
-                self.logger.info(f"  [{idx}] {date_str} - {item.link}")
+            # Log the aggregated items as a single record
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Successfully aggregated %d news items:\n%s",
+                    aggregated_count,
+                    "\n".join(
+                        f"  [{idx}] {item.publication_date:%Y-%m-%d %H:%M:%S} - {item.link}"
+                        for idx, item in enumerate(news_collection, 1)
+                    ),
+                )
 
             # Step 3: Save to file if requested
             if output_file:
-                self.logger.info(f"Saving news items to {output_file}")
+                self.logger.info("Saving news items to %s", output_file)
                 TOMLHandler.write_news_toml(news_collection, output_file)
 
-            # Step 3.1: Filter invalid items
-            self.logger.info("Filtering invalid news items...")
-            valid_items = self._filter_invalid(news_collection)
+            # Step 3.1: Drop items missing a headline or link, or older than yesterday
+            self.logger.info("Filtering invalid and outdated news items...")
+            recent_items = self._prefilter(news_collection)
 
-            if len(valid_items) < len(news_collection):
-                filtered_count = len(news_collection) - len(valid_items)
+            filtered_count = aggregated_count - len(recent_items)
+            if filtered_count:
                 self.logger.info(
-                    f"Filtered out {filtered_count} invalid items (missing headline or link)"
+                    "Filtered out %d items (missing headline or link, or older than yesterday)",
+                    filtered_count,
                 )
 
-            if not valid_items:
+            if not recent_items:
                 self.logger.info(
-                    "No valid news items found (all items are missing headline or link)"
-                )
-                return True
-
-            # Step 3.2: Filter by date (only keep today and yesterday)
-            self.logger.info("Filtering news items by date...")
-            date_filtered_items = self._filter_by_date(valid_items)
-
-            if len(date_filtered_items) < len(valid_items):
-                filtered_count = len(valid_items) - len(date_filtered_items)
-                self.logger.info(
-                    f"Filtered out {filtered_count} items older than yesterday"
-                )
-
-            if not date_filtered_items:
-                self.logger.info(
-                    "No recent news items found (all items are older than yesterday)"
+                    "No valid recent news items found (all items are invalid or older than yesterday)"
                 )
                 return True
 
             # Step 4: Filter duplicates
+            check_duplicates = self.config.check_for_duplicates
             if dry_run:
                 self.logger.info("Skipping duplicate check for dry run")
-                unique_news_items = list(date_filtered_items)
+                unique_news_items = recent_items
+            elif not check_duplicates:
+                self.logger.info("Duplicate checking is disabled")
+                unique_news_items = recent_items
             else:
                 self.logger.info("Checking for duplicates...")
-                unique_news_items = await self._filter_duplicates(date_filtered_items)
+                unique_news_items = await self._filter_duplicates(recent_items)
 
             if not unique_news_items:
                 self.logger.info("All news items were duplicates, nothing to post")
                 return True
 
-            self.logger.info(f"Found {len(unique_news_items)} unique items to post")
+            unique_count = len(unique_news_items)
+            self.logger.info("Found %d unique items to post", unique_count)
 
             # Step 5: Post to Reddit (articles already categorized during aggregation)
-            self.logger.info(f"{'[DRY RUN] ' if dry_run else ''}Posting to Reddit...")
+            self.logger.info("%sPosting to Reddit...", "[DRY RUN] " if dry_run else "")
             submissions = await self.reddit_client.submit_multiple_news_items(
                 unique_news_items, dry_run=dry_run
             )
@@ -157,76 +153,85 @@ class NewsBot:
                         self.deduplicator.store_submission(news_item, submission.id)
 
             # Step 7: Cleanup old records
-            self.logger.info("Cleaning up old duplicate records...")
-            deleted_count = self.deduplicator.cleanup_old_records()
-            self.logger.debug(f"Deleted {deleted_count} old records")
+            if check_duplicates:
+                self.logger.info("Cleaning up old duplicate records...")
+                deleted_count = self.deduplicator.cleanup_old_records()
+                self.logger.debug("Deleted %d old records", deleted_count)
 
             # Step 8: Report results
             successful_count = sum(1 for s in submissions if s is not None)
             self.logger.info(
-                f"Workflow completed: {successful_count}/{len(unique_news_items)} items posted successfully"
+                "Workflow completed: %d/%d items posted successfully",
+                successful_count,
+                unique_count,
             )
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Workflow failed: {e}")
+            self.logger.error("Workflow failed: %s", e)
             self.logger.exception("Full error details:")
             return False
 
-    async def _filter_duplicates(
-        self, news_collection: NewsCollection
-    ) -> List[NewsItem]:
+    def _log_validation_errors(self, errors: list[str]) -> None:
+        """Log configuration validation errors as a single record.
+
+        Args:
+            errors: Validation error messages
+        """
+        self.logger.error(
+            "Configuration validation failed:\n%s",
+            "\n".join(f"  - {error}" for error in errors),
+        )
+
+    async def _filter_duplicates(self, news_items: list[NewsItem]) -> list[NewsItem]:
         """Filter out duplicate news items.
 
+        The whole batch is checked in one call and the result preserves the
+        input order.
+
         Args:
-            news_collection: Collection of news items to filter
+            news_items: News items to filter
 
         Returns:
             List of unique news items
         """
-        unique_items: list[NewsItem] = []
-
-        for news_item in news_collection:
-            is_duplicate, reason = await self.deduplicator.is_duplicate(news_item)
+        results = await self.deduplicator.are_duplicates(news_items)
 
+        unique_items: list[NewsItem] = []
+        duplicates: list[tuple[str, str | None]] = []
+        for news_item, (is_duplicate, reason) in zip(news_items, results):
             if is_duplicate:
-                self.logger.info(f"Skipping duplicate: {news_item.headline} ({reason})")
+                duplicates.append((news_item.headline, reason))
             else:
                 unique_items.append(news_item)
 
-        return unique_items
-
-    def _filter_invalid(self, news_collection: NewsCollection) -> NewsCollection:
-        """Filter out news items that are missing essential fields.
-
-        Args:
-            news_collection: Collection of news items to filter
+        if duplicates:
+            self.logger.info(
+                "Skipped %d duplicates: %s",
+                len(duplicates),
+                "; ".join(f"{headline} ({reason})" for headline, reason in duplicates),
+            )
 
-        Returns:
-            NewsCollection with only valid items (those with headline and link)
-        """
-        return NewsCollection(
-            news_item
-            for news_item in news_collection
-            if news_item.headline and news_item.link
-        )
+        return unique_items
 
-    def _filter_by_date(self, news_collection: NewsCollection) -> NewsCollection:
-        """Filter news items to only include those from today and yesterday.
+    def _prefilter(self, news_collection: NewsCollection) -> list[NewsItem]:
+        """Filter out invalid and outdated news items in a single pass.
 
         Args:
             news_collection: Collection of news items to filter
 
         Returns:
-            NewsCollection with items from today and yesterday only
+            List of items with a headline and link from today or yesterday
         """
         yesterday = (datetime.now() - timedelta(days=1)).date()
-        return NewsCollection(
+        return [
             news_item
             for news_item in news_collection
-            if news_item.publication_date.date() >= yesterday
-        )
+            if news_item.headline
+            and news_item.link
+            and news_item.publication_date.date() >= yesterday
+        ]
 
     def get_statistics(self) -> dict[str, Any]:
         """Get bot statistics.
@@ -282,7 +287,7 @@ async def main() -> None:
 
     try:
         # Load configuration
-        config = Config(args.config)
+        config = get_config(args.config)
 
         # Initialize bot
         bot = NewsBot(config)
@@ -301,13 +306,13 @@ async def main() -> None:
             logger.info("Testing connections...")
 
             try:
-                # Test Reddit
-                reddit_ok = await bot.reddit_client.test_connection()
-
-                # Test LLM API
                 from hudson_news_bot.news.aggregator import test_connection
 
-                llm_ok = await test_connection()
+                # Test Reddit and LLM API concurrently
+                reddit_ok, llm_ok = await asyncio.gather(
+                    bot.reddit_client.test_connection(),
+                    test_connection(bot.news_aggregator.client, config),
+                )
 
                 if reddit_ok and llm_ok:
                     logger.info("✅ All connections successful")
@@ -5,17 +5,28 @@ import datetime
 from logging import Logger
 import logging
 import sys
+from contextlib import aclosing
 from typing import Final
 
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound
 from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletionSystemMessageParam
+from openai.types.shared_params import ResponseFormatJSONSchema
 from pydantic import BaseModel, Field
 
-from hudson_news_bot.config.settings import Config
+from hudson_news_bot.config.settings import Config, get_config
 from hudson_news_bot.news.models import NewsCollection, NewsItem
-from hudson_news_bot.news.scraper import NewsItemDict, WebsiteScraper
+from hudson_news_bot.news.scraper import (
+    CONTENT_PREVIEW_CHARS,
+    NewsItemDict,
+    WebsiteScraper,
+    normalize_url,
+)
 from hudson_news_bot.reddit.client import RedditClient
 
+# Most scraped articles sent to the LLM in a single aggregation run
+MAX_ANALYSIS_ARTICLES: Final = 20
+
 
 class NewsItemResponse(BaseModel):
     """Pydantic model for structured LLM response - single news item."""
@@ -37,6 +48,41 @@ class NewsResponse(BaseModel):
     )
 
 
+def _build_example_json(has_flair: bool) -> str:
+    """Render the example response shown in the analysis prompt.
+
+    Args:
+        has_flair: Whether the example should include a flair field
+
+    Returns:
+        Indented JSON generated from the response models (source of truth)
+    """
+    example_item = NewsItemResponse(
+        headline="story headline",
+        summary="brief 2-3 sentence summary of the article",
+        publication_date="YYYY-MM-DD",
+        link="https://source.com/article",
+        flair="category name" if has_flair else None,
+    )
+    example_response = NewsResponse(news=[example_item])
+    return example_response.model_dump_json(exclude_none=not has_flair, indent=2)
+
+
+# Example responses for prompts with and without flair options
+EXAMPLE_JSON: Final = {
+    has_flair: _build_example_json(has_flair) for has_flair in (False, True)
+}
+
+# Structured-output request format, derived once from the response models
+RESPONSE_FORMAT: Final[ResponseFormatJSONSchema] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "hudson_news_response",
+        "schema": NewsResponse.model_json_schema(),
+    },
+}
+
+
 class NewsAggregator:
     """Handles news aggregation using OpenAI-compatible LLM API."""
 
@@ -79,6 +125,13 @@ class NewsAggregator:
                 autoescape=False,  # Rendering prompts, not HTML  # nosec B701
             )
             self._system_template = self._jinja_env.get_template("system.jinja")
+            # The system prompt has no variables, so render it once and share the
+            # message across every request made by this aggregator.
+            self._system_prompt = self._system_template.render()
+            self._system_message: ChatCompletionSystemMessageParam = {
+                "role": "system",
+                "content": self._system_prompt,
+            }
             self._analysis_template = self._jinja_env.get_template("analysis.jinja")
             self.logger.info(f"Loaded prompt templates from {config.prompts_dir}")
         except TemplateNotFound as e:
@@ -89,6 +142,17 @@ class NewsAggregator:
         except Exception as e:
             raise ValueError(f"Failed to load prompt templates: {e}")
 
+        # Caps the analysis requests in flight when articles span several
+        # batches. Clamped because the aggregator is built before
+        # Config.validate() gets to report a non-positive value.
+        self._llm_semaphore: Final = asyncio.Semaphore(
+            max(1, config.llm_max_concurrency)
+        )
+
+    async def close(self) -> None:
+        """Close the LLM client's HTTP connection pool."""
+        await self.client.close()
+
     async def aggregate_news(self) -> NewsCollection:
         """Aggregate news stories using website scraping and LLM analysis.
 
@@ -105,50 +169,140 @@ class NewsAggregator:
         # Get news sites from configuration
         news_sites = self.config.news_sites
 
-        # Scrape the websites
+        # Fetch flair options while the sites are scraped; they are only
+        # needed once the first batch is ready for analysis
+        flair_task = asyncio.create_task(self._get_flair_options())
+
+        # Scrape the websites, sending each batch to the LLM as soon as it fills
+        # so analysis overlaps with fetching the remaining article pages
         scraper = WebsiteScraper(self.config)
-        articles = await scraper.scrape_news_sites(news_sites)
+        batch_size = max(1, self.config.llm_batch_size)
+        batch: list[NewsItemDict] = []
+        tasks: list[asyncio.Task[NewsCollection]] = []
+        article_count = 0
 
-        if not articles:
-            self.logger.warning("No articles found from scraping")
-            return NewsCollection()
+        try:
+            async with aclosing(scraper.stream_news_sites(news_sites)) as articles:
+                async for article in articles:
+                    batch.append(article)
+                    article_count += 1
+                    if len(batch) == batch_size:
+                        flair_options = await flair_task
+                        tasks.append(
+                            asyncio.create_task(
+                                self._analyze_articles(batch, flair_options)
+                            )
+                        )
+                        batch = []
+                    if article_count == MAX_ANALYSIS_ARTICLES:
+                        break
+
+            if batch:
+                flair_options = await flair_task
+                tasks.append(
+                    asyncio.create_task(self._analyze_articles(batch, flair_options))
+                )
+
+            if not tasks:
+                self.logger.warning("No articles found from scraping")
+                return NewsCollection()
+
+            self.logger.info(
+                f"Scraped {article_count} articles, "
+                f"sent to LLM for analysis in {len(tasks)} batches"
+            )
+
+            collections = await asyncio.gather(*tasks)
+        finally:
+            # No-op for finished tasks; stops leftovers after an early exit
+            flair_task.cancel()
+            for task in tasks:
+                task.cancel()
+
+        if len(collections) == 1:
+            return collections[0]
+        return self._merge_collections(collections)
 
+    def _merge_collections(self, collections: list[NewsCollection]) -> NewsCollection:
+        """Merge per-batch results, dropping stories repeated across batches.
+
+        Each batch is analyzed independently, so the same story scraped from
+        two sites can be selected twice. The first item with a given link or
+        headline is kept.
+
+        Args:
+            collections: Analysis results in batch order
+
+        Returns:
+            NewsCollection with each story at most once
+        """
+        seen_links: set[str] = set()
+        seen_headlines: set[str] = set()
+        merged: list[NewsItem] = []
+        for item in (item for collection in collections for item in collection):
+            link = normalize_url(item.link)
+            headline = " ".join(item.headline.lower().split())
+            if link in seen_links or headline in seen_headlines:
+                self.logger.debug(
+                    "Dropping story repeated across batches: %s", item.link
+                )
+                continue
+            seen_links.add(link)
+            seen_headlines.add(headline)
+            merged.append(item)
+        return NewsCollection(merged)
+
+    async def _get_flair_options(self) -> dict[str, str]:
+        """Get flair options from Reddit for categorization.
+
+        Returns:
+            Mapping of flair text to template IDs, empty if unavailable
+        """
+        if not self.reddit_client:
+            return {}
+
+        try:
+            flair_options = await self.reddit_client.get_flair_options()
+        except Exception as e:
+            self.logger.warning(f"Could not get flair options: {e}")
+            return {}
+
+        self.flair_mapping = flair_options  # Store for later use
         self.logger.info(
-            f"Scraped {len(articles)} articles, sending to LLM for analysis"
+            f"Retrieved {len(flair_options)} flair options for categorization"
         )
+        return flair_options
 
-        # Get flair options if reddit client is available
-        flair_options = {}
-        if self.reddit_client:
-            try:
-                flair_options = await self.reddit_client.get_flair_options()
-                self.flair_mapping = flair_options  # Store for later use
-                self.logger.info(
-                    f"Retrieved {len(flair_options)} flair options for categorization"
-                )
-            except Exception as e:
-                self.logger.warning(f"Could not get flair options: {e}")
+    async def _analyze_articles(
+        self, articles: list[NewsItemDict], flair_options: dict[str, str]
+    ) -> NewsCollection:
+        """Send one batch of scraped articles to the LLM for analysis.
+
+        Args:
+            articles: Scraped articles to analyze
+            flair_options: Mapping of flair text to template IDs
 
+        Returns:
+            NewsCollection with the items the LLM selected
+
+        Raises:
+            Exception: If the request fails or returns no content
+        """
         # Send scraped content to LLM for analysis with structured output
         prompt = self.render_analysis_prompt(articles, flair_options)
         self.logger.debug("Sending analysis prompt to LLM with structured output")
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.config.llm_model,
-                messages=[
-                    {"role": "system", "content": self._system_template.render()},
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=self.config.llm_max_tokens,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "hudson_news_response",
-                        "schema": NewsResponse.model_json_schema(),
-                    },
-                },
-            )
+            async with self._llm_semaphore:
+                response = await self.client.chat.completions.create(
+                    model=self.config.llm_model,
+                    messages=[
+                        self._system_message,
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=self.config.llm_max_tokens,
+                    response_format=RESPONSE_FORMAT,
+                )
 
             # Parse structured response
             if response.choices and response.choices[0].message.content:
@@ -176,46 +330,31 @@ class NewsAggregator:
         Raises:
             ValueError: If template rendering fails
         """
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-
-        # Limit to first 20 articles and truncate content
-        limited_articles = []
-        for article in articles[:20]:
-            limited_articles.append(
-                {
-                    "url": article.get("url", "N/A"),
-                    "headline": article.get("headline", "N/A"),
-                    "date": article.get("date", "N/A"),
-                    "content": (article.get("content") or "N/A")[:500],
-                }
-            )
-
-        # Generate example response from Pydantic model (source of truth)
-        has_flair = bool(flair_options)
-        example_item = NewsItemResponse(
-            headline="story headline",
-            summary="brief 2-3 sentence summary of the article",
-            publication_date="YYYY-MM-DD",
-            link="https://source.com/article",
-            flair="category name" if has_flair else None,
-        )
-        example_response = NewsResponse(news=[example_item])
-        example_json = example_response.model_dump_json(
-            exclude_none=not has_flair, indent=2
-        )
+        today = datetime.date.today().isoformat()
+
+        # Limit the number of articles and truncate content
+        limited_articles = [
+            {
+                "url": article.get("url", "N/A"),
+                "headline": article.get("headline", "N/A"),
+                "date": article.get("date", "N/A"),
+                "content": (article.get("content") or "N/A")[:CONTENT_PREVIEW_CHARS],
+            }
+            for article in articles[:MAX_ANALYSIS_ARTICLES]
+        ]
 
         context = {
             "today": today,
             "articles": limited_articles,
             "flair_options": flair_options or {},
-            "example_json": example_json,
+            "example_json": EXAMPLE_JSON[bool(flair_options)],
         }
 
         try:
             return self._analysis_template.render(**context)
         except Exception as e:
             self.logger.error(f"Template rendering failed: {e}")
-            self.logger.debug(f"Context keys: {context.keys()}")
+            self.logger.debug("Context keys: %s", context.keys())
             raise ValueError(f"Failed to render analysis prompt: {e}")
 
     def _parse_structured_response(self, response: str) -> NewsCollection:
@@ -230,36 +369,37 @@ class NewsAggregator:
         Raises:
             ValueError: If response cannot be parsed
         """
-        self.logger.debug(f"Parsing structured response: {response[:200]}...")
+        self.logger.debug("Parsing structured response: %.200s...", response)
 
         try:
             # Parse with Pydantic model
             news_response = NewsResponse.model_validate_json(response)
 
-            # Convert to NewsItem objects
-            news_items: list[NewsItem] = []
-            for item in news_response.news:
-                # Parse date
-                pub_date = datetime.datetime.strptime(item.publication_date, "%Y-%m-%d")
-
-                # Get flair ID if flair text is provided
-                flair_id = None
-                if item.flair:
-                    flair_id = self.flair_mapping.get(item.flair)
-                    if flair_id is None:
-                        self.logger.warning(
-                            f"Flair '{item.flair}' not found in mapping"
-                        )
+            # Report unknown flairs once for the whole response
+            missing_flairs = {
+                item.flair
+                for item in news_response.news
+                if item.flair and item.flair not in self.flair_mapping
+            }
+            if missing_flairs:
+                self.logger.warning(
+                    "Flairs not found in mapping: %s",
+                    ", ".join(sorted(missing_flairs)),
+                )
 
-                news_items.append(
-                    NewsItem(
-                        headline=item.headline,
-                        summary=item.summary,
-                        publication_date=pub_date,
-                        link=item.link,
-                        flair_id=flair_id,
-                    )
+            # Convert to NewsItem objects, with the per-item lookups bound once
+            parse_date = datetime.datetime.fromisoformat
+            flair_id_for = self.flair_mapping.get
+            news_items = [
+                NewsItem(
+                    headline=item.headline,
+                    summary=item.summary,
+                    publication_date=parse_date(item.publication_date),
+                    link=item.link,
+                    flair_id=flair_id_for(item.flair) if item.flair else None,
                 )
+                for item in news_response.news
+            ]
 
             self.logger.info(
                 f"Successfully parsed {len(news_items)} news items from structured output"
@@ -268,34 +408,43 @@ class NewsAggregator:
 
         except Exception as e:
             self.logger.error(f"Failed to parse structured response: {e}")
-            self.logger.debug(f"Raw response: {response}")
+            self.logger.debug("Raw response: %s", response)
             raise ValueError(f"Failed to parse structured LLM response: {e}")
 
 
-async def test_connection() -> bool:
+async def test_connection(
+    client: AsyncOpenAI | None = None, config: Config | None = None
+) -> bool:
     """Test connection to LLM API.
 
+    Args:
+        client: Existing client to test, so its pooled connection is reused;
+            a temporary client is created from the configuration if omitted
+        config: Configuration the client was built from; the default
+            configuration is loaded if omitted
+
     Returns:
         True if connection successful, False otherwise
     """
     logger = logging.getLogger(__name__)
 
     try:
-        config = Config()
+        if config is None:
+            config = get_config()
 
         logger.info("Testing LLM API connection...")
 
-        # Create OpenAI client
-        api_key = config.llm_api_key
-        if not api_key:
-            logger.error("❌ LLM_API_KEY or PERPLEXITY_API_KEY not set")
-            return False
+        if client is None:
+            api_key = config.llm_api_key
+            if not api_key:
+                logger.error("❌ LLM_API_KEY or PERPLEXITY_API_KEY not set")
+                return False
 
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=config.llm_base_url,
-            timeout=config.llm_timeout_seconds,
-        )
+            client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=config.llm_base_url,
+                timeout=config.llm_timeout_seconds,
+            )
 
         # Simple test query
         response = await client.chat.completions.create(
@@ -8,7 +8,7 @@ from typing import Final, Iterator
 import tomli_w
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """Represents a single news article."""
 
@@ -24,7 +24,7 @@ class NewsItem:
         result = {
             "headline": self.headline,
             "summary": self.summary,
-            "publication_date": self.publication_date.strftime("%Y-%m-%d"),
+            "publication_date": self.publication_date.date().isoformat(),
             "link": self.link,
         }
         if self.flair:
@@ -34,14 +34,23 @@ class NewsItem:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsCollection:
     """Collection of news items with TOML serialization support."""
 
     news: Final[list[NewsItem]]
 
     def __init__(self, news: Iterable[NewsItem] | None = None) -> None:
-        self.news = list(news) if news is not None else []
+        """Initialize the collection.
+
+        Args:
+            news: News items; a list is adopted as-is rather than copied
+        """
+        if news is None:
+            news = []
+        elif not isinstance(news, list):
+            news = list(news)
+        self.news = news
 
     def to_toml_string(self) -> str:
         """Convert collection to TOML string format."""
@@ -54,4 +63,4 @@ class NewsCollection:
 
     def __iter__(self) -> Iterator[NewsItem]:
         """Make collection iterable."""
-        yield from self.news
+        return iter(self.news)
@@ -5,23 +5,182 @@ import hashlib
 import json
 import logging
 import os
+import random
 import re
 import sqlite3
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Final, Optional, Tuple, TypedDict
+from typing import Any, Final, Optional, TypedDict
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
-from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from bs4.filter import SoupStrainer
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Playwright,
+    Route,
+    ViewportSize,
+)
+from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
 from hudson_news_bot.config.settings import Config
 
+# Article text kept per scraped page; only this prefix is ever used downstream
+CONTENT_PREVIEW_CHARS: Final = 500
+
+# Resource types never needed to extract article text, so never downloaded
+BLOCKED_RESOURCE_TYPES: Final = frozenset(
+    {"image", "stylesheet", "font", "media", "texttrack"}
+)
+
+# Pages opened in one browser context before it is replaced, bounding the
+# memory Playwright accumulates per context over a long crawl
+CONTEXT_ROTATE_PAGES: Final = 25
+
+# Selectors tried in order when extracting an article's fields
+HEADLINE_SELECTORS: Final = (
+    "h1.article-title",
+    "h1.headline",
+    "h1[itemprop='headline']",
+    "h1",
+    "h2.article-title",
+    "title",
+)
+DATE_SELECTORS: Final = (
+    "time[datetime]",
+    "meta[property='article:published_time']",
+    "meta[name='publish_date']",
+    "span.date",
+    "div.published-date",
+)
+CONTENT_SELECTORS: Final = (
+    "article",
+    "div.article-content",
+    "div.story-content",
+    "div.entry-content",
+    "main",
+    "div[itemprop='articleBody']",
+)
+
+# URL paths that look like articles, and paths that never are
+ARTICLE_LINK_RE: Final = re.compile(
+    r"/\d{4}/\d{2}/\d{2}/|/article/|/local-news/|/news/|/story/|/posts/\d+"
+)
+EXCLUDED_LINK_RE: Final = re.compile(r"/news/national/|/category/|/tag/|/page/\d+|#")
+
+# Date formats recognized in article text when no structured date is present,
+# and how much of the text is searched for one
+DATE_TEXT_RE: Final = re.compile(
+    r"\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}"
+    r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}"
+)
+DATE_SCAN_CHARS: Final = 10_000
+
+# Restricts link extraction to parsing anchors with an href
+LINK_STRAINER: Final = SoupStrainer("a", href=True)
+
+# Scraped-article rows queued before they are written in one transaction
+WRITE_BATCH_SIZE: Final = 64
+
+# Removes elements no extractor reads before the page is serialized, so less
+# HTML crosses from the browser and less is parsed
+STRIP_UNUSED_ELEMENTS_JS: Final = (
+    "document.querySelectorAll('script, style, noscript, svg, template')"
+    ".forEach((element) => element.remove())"
+)
+
+# Viewport and user agent are set once per context rather than on every page
+VIEWPORT: Final[ViewportSize] = {"width": 1280, "height": 720}
+
 USER_AGENT: Final = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
 
 
+@lru_cache(maxsize=8192)
+def normalize_url(url: str) -> str:
+    """Normalize URL for deduplication.
+
+    Results are cached because each article URL is normalized several times
+    per crawl: when links are collected, checked and stored.
+
+    Args:
+        url: Original URL
+
+    Returns:
+        Normalized URL
+    """
+    url = url.rstrip("/").lower()
+    fragment_pos = url.find("#")
+    if fragment_pos != -1:
+        url = url[:fragment_pos]
+
+    query_pos = url.find("?")
+    if query_pos != -1:
+        base_url = url[:query_pos]
+        params = url[query_pos + 1 :].lower()
+
+        tracking_prefixes = {"utm_", "fbclid", "gclid"}
+        tracking_substrings = {"ref=", "source="}
+
+        essential_params = [
+            param
+            for param in params.split("&")
+            if not (
+                any(param.startswith(prefix) for prefix in tracking_prefixes)
+                or any(substring in param for substring in tracking_substrings)
+            )
+        ]
+
+        if essential_params:
+            url = f"{base_url}?{'&'.join(essential_params)}"
+        else:
+            url = base_url
+
+    return url.lower()
+
+
+@lru_cache(maxsize=8192)
+def hash_string(text: str) -> str:
+    """Create hash of string for comparison.
+
+    Args:
+        text: String to hash
+
+    Returns:
+        Hex digest of the string
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def leading_text(soup: BeautifulSoup, limit: int) -> str:
+    """Get the first characters of a document's text.
+
+    Matches ``soup.get_text()[:limit]`` but stops walking the tree once
+    enough text is collected, instead of joining every string in the page.
+
+    Args:
+        soup: Parsed document
+        limit: Most characters to return
+
+    Returns:
+        Up to limit characters of the document's text
+    """
+    parts: list[str] = []
+    size = 0
+    for string in soup.strings:
+        parts.append(string)
+        size += len(string)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
 def get_hudson_hub_times_email() -> str | None:
     """Get Hudson Hub Times email from environment."""
     return os.getenv("HUDSON_HUB_TIMES_EMAIL")
@@ -55,6 +214,17 @@ class WebsiteScraper:
         self.playwright: Playwright | None = None
         self.browser_context: BrowserContext | None = None
 
+        # Pages opened in the current context, and pages still open per context
+        self._context_pages = 0
+        self._open_pages: dict[BrowserContext, int] = {}
+        self._rotate_lock: Final = asyncio.Lock()
+
+        # Normalized listing-page URLs, so page checks are one set lookup
+        self._news_site_set: Final = frozenset(
+            self._normalize_url(str(news_site))
+            for news_site in getattr(config, "news_sites", [])
+        )
+
         # Set up database for tracking scraped URLs
         self.db_path: Final = Path(config.database_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -66,6 +236,10 @@ class WebsiteScraper:
         # Cache configuration
         self.skip_recently_scraped: Final = config.skip_recently_scraped
         self.scraping_cache_hours: Final = config.scraping_cache_hours
+        self._recent_hashes: set[str] | None = None
+        self._pending_writes: list[
+            tuple[str, str, str, str | None, str | None, str, bool]
+        ] = []
 
         # Authentication credentials
         self.hudson_hub_times_email = get_hudson_hub_times_email()
@@ -101,9 +275,33 @@ class WebsiteScraper:
                 "CREATE INDEX IF NOT EXISTS idx_scrape_success ON scraped_articles(scrape_success)"
             )
 
+            self._migrate_url_hashes(conn)
+
             conn.commit()
             self.logger.debug("Scraping database initialized")
 
+    def _migrate_url_hashes(self, conn: sqlite3.Connection) -> None:
+        """Re-key rows stored with the former SHA-256 URL hashes.
+
+        URL hashes are recomputed from the stored normalized URL, so previously
+        scraped articles keep counting as recently scraped. A URL that already
+        has a row under its new hash keeps that row and drops the old one.
+
+        Args:
+            conn: Open connection to the scraping database
+        """
+        rows = conn.execute(
+            "SELECT id, normalized_url FROM scraped_articles "
+            "WHERE length(url_hash) = 64"
+        ).fetchall()
+        if rows:
+            conn.executemany(
+                "UPDATE OR IGNORE scraped_articles SET url_hash = ? WHERE id = ?",
+                [(self._hash_string(url), row_id) for row_id, url in rows],
+            )
+            conn.execute("DELETE FROM scraped_articles WHERE length(url_hash) = 64")
+            self.logger.info(f"Migrated {len(rows)} scraped article URL hashes")
+
     async def authenticate_hudson_hub_times(self) -> bool:
         """Authenticate with Hudson Hub Times login.
 
@@ -127,7 +325,7 @@ class WebsiteScraper:
 
             # Navigate to the login page
             login_url = "https://login.beaconjournal.com/NABJ-GUP/authenticate/"
-            self.logger.debug(f"Navigating to login page: {login_url}")
+            self.logger.debug("Navigating to login page: %s", login_url)
             await page.goto(login_url, wait_until="domcontentloaded", timeout=30000)
 
             # Wait for the login form to load
@@ -210,7 +408,9 @@ class WebsiteScraper:
             )
 
             # Create a persistent browser context
-            self.browser_context = await self.browser.new_context(user_agent=USER_AGENT)
+            self.browser_context = await self.browser.new_context(
+                user_agent=USER_AGENT, viewport=VIEWPORT
+            )
 
             # Load saved cookies if they exist
             if self.cookies_path.exists():
@@ -228,11 +428,28 @@ class WebsiteScraper:
             # Authenticate with Hudson Hub Times
             await self.authenticate_hudson_hub_times()
 
+            # Skip page assets from here on; the login form loads normally
+            # in case its submit button relies on them
+            await self.browser_context.route("**/*", self._block_assets)
+
         self.logger.info("Playwright browser launched with cookies")
         return self
 
+    async def _block_assets(self, route: Route) -> None:
+        """Abort requests for resources that text extraction never uses.
+
+        Args:
+            route: Intercepted browser request
+        """
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit - close browser."""
+        self._flush_writes()
+
         if self.browser_context:
             # Save cookies before closing context
             try:
@@ -281,16 +498,14 @@ class WebsiteScraper:
             self.logger.info(f"Skipping recently scraped URL: {url}")
             return url, ""
 
+        context = None
         page = None
         try:
             self.logger.debug(
-                f"Fetching {url} with Playwright (attempt {retry_count + 1})"
+                "Fetching %s with Playwright (attempt %d)", url, retry_count + 1
             )
-            page = await self.browser_context.new_page()
-
-            # Set a reasonable viewport and user agent
-            await page.set_viewport_size({"width": 1280, "height": 720})
-            await page.set_extra_http_headers({"User-Agent": USER_AGENT})
+            context = await self._acquire_context()
+            page = await context.new_page()
 
             # Navigate to the page with increased timeout
             await page.goto(url, wait_until="domcontentloaded", timeout=60000)
@@ -302,10 +517,11 @@ class WebsiteScraper:
                 )
             except PlaywrightTimeout:
                 self.logger.debug(
-                    f"No content selector found for {url}, continuing anyway"
+                    "No content selector found for %s, continuing anyway", url
                 )
 
-            # Get the page content
+            # Get the page content, minus markup extraction never reads
+            await page.evaluate(STRIP_UNUSED_ELEMENTS_JS)
             html = await page.content()
             self.logger.info(f"Successfully fetched {url} ({len(html)} bytes)")
 
@@ -341,13 +557,82 @@ class WebsiteScraper:
         finally:
             if page:
                 await page.close()
+            if context is not None:
+                await self._release_context(context)
+
+    async def _acquire_context(self) -> BrowserContext:
+        """Get the browser context to open the next page in.
+
+        The context is replaced with a fresh one, carrying over its cookies and
+        storage, once CONTEXT_ROTATE_PAGES pages have been opened in it.
+
+        Returns:
+            The current browser context
+
+        Raises:
+            RuntimeError: If the browser has not been started
+        """
+        if self._context_pages >= CONTEXT_ROTATE_PAGES:
+            async with self._rotate_lock:
+                # Another fetch may have rotated while this one waited
+                if self._context_pages >= CONTEXT_ROTATE_PAGES:
+                    await self._rotate_context()
+
+        if not self.browser_context:
+            raise RuntimeError(
+                "Browser context not initialized. Use async context manager."
+            )
+
+        context = self.browser_context
+        self._context_pages += 1
+        self._open_pages[context] = self._open_pages.get(context, 0) + 1
+        return context
+
+    async def _release_context(self, context: BrowserContext) -> None:
+        """Record that a page opened by _acquire_context has been closed.
+
+        Args:
+            context: Context the page was opened in
+        """
+        remaining = self._open_pages[context] - 1
+        if remaining or context is self.browser_context:
+            self._open_pages[context] = remaining
+        else:
+            # Last page of a context that has been rotated out
+            del self._open_pages[context]
+            await context.close()
+
+    async def _rotate_context(self) -> None:
+        """Replace the browser context to release memory Playwright holds on to.
+
+        The old context is closed right away if it has no open pages,
+        otherwise when its last page is released.
+
+        Raises:
+            RuntimeError: If the browser has not been started
+        """
+        if not self.browser or not self.browser_context:
+            raise RuntimeError("Browser not initialized. Use async context manager.")
+
+        old_context = self.browser_context
+        state = await old_context.storage_state()
+        self.browser_context = await self.browser.new_context(
+            user_agent=USER_AGENT, viewport=VIEWPORT, storage_state=state
+        )
+        await self.browser_context.route("**/*", self._block_assets)
+        self._context_pages = 0
+        self.logger.debug("Rotated browser context")
+
+        if not self._open_pages.get(old_context):
+            self._open_pages.pop(old_context, None)
+            await old_context.close()
 
     # Copy all the other methods from the original scraper
     async def fetch_all_websites(self, urls: list[str]) -> dict[str, str]:
         """Fetch HTML content from multiple websites concurrently."""
-        semaphore = asyncio.Semaphore(2)
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_fetches)
 
-        async def fetch_with_limit(url: str) -> Tuple[str, str]:
+        async def fetch_with_limit(url: str) -> tuple[str, str]:
             async with semaphore:
                 return await self.fetch_website(url)
 
@@ -369,39 +654,19 @@ class WebsiteScraper:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        # Only anchors are needed, so skip building the rest of the tree
+        soup = BeautifulSoup(html, "html.parser", parse_only=LINK_STRAINER)
         links: set[str] = set()
 
-        article_patterns = [
-            r"/\d{4}/\d{2}/\d{2}/",
-            r"/article/",
-            r"/local-news/",
-            r"/news/",
-            r"/story/",
-            r"/posts/\d+",
-        ]
-
-        exclude_patterns = [
-            r"/news/national/",
-            r"/category/",
-            r"/tag/",
-            r"/page/\d+",
-            r"#",
-        ]
-
         for link in soup.find_all("a", href=True):
             if isinstance(link, Tag) and (href := link.get("href", "")):
-                href = str(href).strip()
-                absolute_url = urljoin(base_url, href)
+                absolute_url = urljoin(base_url, str(href).strip())
+                lower_url = absolute_url.lower()
 
-                if any(
-                    re.search(pattern, absolute_url.lower())
-                    for pattern in article_patterns
+                if ARTICLE_LINK_RE.search(lower_url) and not EXCLUDED_LINK_RE.search(
+                    lower_url
                 ):
-                    if not any(
-                        pattern in absolute_url.lower() for pattern in exclude_patterns
-                    ):
-                        links.add(absolute_url)
+                    links.add(absolute_url)
 
         return list(links)
 
@@ -418,30 +683,14 @@ class WebsiteScraper:
         )
 
         # Extract headline - try multiple selectors
-        headline_selectors = [
-            "h1.article-title",
-            "h1.headline",
-            "h1[itemprop='headline']",
-            "h1",
-            "h2.article-title",
-            "title",
-        ]
-        for selector in headline_selectors:
+        for selector in HEADLINE_SELECTORS:
             element = soup.select_one(selector)
             if element and element.text.strip():
                 result["headline"] = element.text.strip()
                 break
 
         # Extract date - look for various date indicators
-        date_selectors = [
-            "time[datetime]",
-            "meta[property='article:published_time']",
-            "meta[name='publish_date']",
-            "span.date",
-            "div.published-date",
-        ]
-
-        for selector in date_selectors:
+        for selector in DATE_SELECTORS:
             if selector.startswith("meta"):
                 element = soup.select_one(selector)
                 if element and hasattr(element, "get"):
@@ -474,31 +723,14 @@ class WebsiteScraper:
                         except Exception:
                             continue
 
-        # If no structured date found, search in text
+        # If no structured date found, take the first date-like text near the top
         if not result["date"]:
-            date_patterns = [
-                r"\d{4}-\d{2}-\d{2}",
-                r"\d{1,2}/\d{1,2}/\d{4}",
-                r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}",
-            ]
-            text = soup.get_text()
-            for pattern in date_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    result["date"] = match.group(0)
-                    break
+            match = DATE_TEXT_RE.search(leading_text(soup, DATE_SCAN_CHARS))
+            if match:
+                result["date"] = match.group(0)
 
         # Extract article content - try various content selectors
-        content_selectors = [
-            "article",
-            "div.article-content",
-            "div.story-content",
-            "div.entry-content",
-            "main",
-            "div[itemprop='articleBody']",
-        ]
-
-        for selector in content_selectors:
+        for selector in CONTENT_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 for script in element(["script", "style"]):
@@ -510,7 +742,7 @@ class WebsiteScraper:
                         p.text.strip() for p in paragraphs[:10] if p.text.strip()
                     )
                     if content:
-                        result["content"] = content[:2000]
+                        result["content"] = content[:CONTENT_PREVIEW_CHARS]
                         if len(paragraphs) > 1:
                             result["summary"] = " ".join(
                                 p.text.strip() for p in paragraphs[:2] if p.text.strip()
@@ -525,144 +757,238 @@ class WebsiteScraper:
             # Fetch all main pages
             self.logger.info(f"Fetching {len(sites)} news sites...")
             site_content = await self.fetch_all_websites(sites)
+            articles_to_fetch = self._collect_article_urls(site_content)
 
-            # Track all article URLs to avoid duplicates
-            all_article_urls: set[str] = set()
-            articles_to_fetch: list[str] = []
+            # Fetch all unique article pages that haven't been scraped recently
+            all_articles: list[NewsItemDict] = []
+            seen_headlines: set[str] = set()
+            seen_content_hashes: set[int] = set()
+
+            if articles_to_fetch:
+                article_content = await self.fetch_all_websites(articles_to_fetch)
 
-            # First pass: collect all unique article URLs
-            for site_url, html in site_content.items():
-                if not html:
-                    continue
+                for article_url, article_html in article_content.items():
+                    article_data = self._accept_article(
+                        article_url, article_html, seen_headlines, seen_content_hashes
+                    )
+                    if article_data:
+                        all_articles.append(article_data)
 
-                article_links = self.extract_article_links(html, site_url)
-                self.logger.info(
-                    f"Found {len(article_links)} article links on {site_url}"
-                )
+            self._finish_scrape(len(all_articles))
+            return all_articles
 
-                for link in article_links:
-                    normalized_url = self._normalize_url(link)
-                    if normalized_url not in all_article_urls:
-                        all_article_urls.add(normalized_url)
+    async def stream_news_sites(
+        self, sites: list[str]
+    ) -> AsyncGenerator[NewsItemDict, None]:
+        """Scrape news sites, yielding each article as soon as it is extracted.
 
-                        if not self._check_if_recently_scraped(link):
-                            articles_to_fetch.append(link)
-                        else:
-                            self.logger.debug(f"Skipping recently scraped: {link}")
+        Unlike scrape_news_sites, articles are produced in the order their
+        pages finish loading, so callers can start processing them while the
+        remaining pages are still being fetched. Closing the iterator early
+        cancels any outstanding fetches.
 
-            self.logger.info(
-                f"Found {len(articles_to_fetch)} new article URLs to fetch "
-                f"(filtered from {len(all_article_urls)} unique URLs)"
-            )
+        Args:
+            sites: News site URLs to scrape
+
+        Yields:
+            Unique articles with a headline and content
+        """
+        async with self:
+            self.logger.info(f"Fetching {len(sites)} news sites...")
+            site_content = await self.fetch_all_websites(sites)
+            articles_to_fetch = self._collect_article_urls(site_content)
 
-            # Fetch all unique article pages that haven't been scraped recently
-            all_articles: list[NewsItemDict] = []
             seen_headlines: set[str] = set()
             seen_content_hashes: set[int] = set()
+            article_count = 0
 
-            if articles_to_fetch:
-                article_content = await self.fetch_all_websites(articles_to_fetch)
+            async with aclosing(self._iter_websites(articles_to_fetch)) as pages:
+                async for article_url, article_html in pages:
+                    article_data = self._accept_article(
+                        article_url, article_html, seen_headlines, seen_content_hashes
+                    )
+                    if article_data:
+                        article_count += 1
+                        yield article_data
 
-                for article_url, article_html in article_content.items():
-                    if article_html:
-                        article_data = self.extract_article_content(
-                            article_html, article_url
-                        )
+            self._finish_scrape(article_count)
 
-                        # Skip if missing required data
-                        if not (article_data["headline"] and article_data["content"]):
-                            self._store_scraped_article(
-                                article_url,
-                                headline=article_data.get("headline"),
-                                success=False,
-                            )
-                            continue
+    async def _iter_websites(
+        self, urls: list[str]
+    ) -> AsyncGenerator[tuple[str, str], None]:
+        """Fetch websites concurrently, yielding each as soon as it completes.
 
-                        # Deduplicate by headline
-                        headline_normalized = article_data["headline"].lower().strip()
-                        if headline_normalized in seen_headlines:
-                            self.logger.debug(
-                                f"Skipping duplicate headline: {article_data['headline']}"
-                            )
-                            continue
+        Args:
+            urls: Website URLs to fetch
 
-                        # Deduplicate by content hash
-                        content_hash = hash(
-                            article_data["content"][:500].lower().strip()
-                        )
-                        if content_hash in seen_content_hashes:
-                            self.logger.debug(
-                                f"Skipping duplicate content for: {article_data['headline']}"
-                            )
-                            continue
+        Yields:
+            Tuples of (url, html_content) in completion order
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_fetches)
 
-                        # Add to results and mark as seen
-                        seen_headlines.add(headline_normalized)
-                        seen_content_hashes.add(content_hash)
-                        all_articles.append(article_data)
+        async def fetch_with_limit(url: str) -> tuple[str, str]:
+            async with semaphore:
+                return await self.fetch_website(url)
 
-                        # Update stored article with extracted content
-                        self._store_scraped_article(
-                            article_url,
-                            headline=article_data["headline"],
-                            content=article_data["content"],
-                            success=True,
-                        )
+        tasks = [asyncio.create_task(fetch_with_limit(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except (PlaywrightError, RuntimeError) as e:
+                    self.logger.error(f"Error fetching article: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            self.logger.info(
-                f"Extracted {len(all_articles)} unique articles after deduplication"
+    def _collect_article_urls(self, site_content: dict[str, str]) -> list[str]:
+        """Collect unique article URLs from news site pages.
+
+        Args:
+            site_content: Mapping of news site URL to its HTML
+
+        Returns:
+            Article URLs that have not been scraped recently
+        """
+        # Track all article URLs to avoid duplicates
+        all_article_urls: set[str] = set()
+        articles_to_fetch: list[str] = []
+
+        for site_url, html in site_content.items():
+            if not html:
+                continue
+
+            article_links = self.extract_article_links(html, site_url)
+            self.logger.info(f"Found {len(article_links)} article links on {site_url}")
+
+            for link in article_links:
+                normalized_url = self._normalize_url(link)
+                if normalized_url not in all_article_urls:
+                    all_article_urls.add(normalized_url)
+
+                    if not self._check_if_recently_scraped(link):
+                        articles_to_fetch.append(link)
+                    else:
+                        self.logger.debug("Skipping recently scraped: %s", link)
+
+        self.logger.info(
+            f"Found {len(articles_to_fetch)} new article URLs to fetch "
+            f"(filtered from {len(all_article_urls)} unique URLs)"
+        )
+        return articles_to_fetch
+
+    def _accept_article(
+        self,
+        article_url: str,
+        article_html: str,
+        seen_headlines: set[str],
+        seen_content_hashes: set[int],
+    ) -> NewsItemDict | None:
+        """Extract an article page and record it unless it is a duplicate.
+
+        Args:
+            article_url: URL of the article page
+            article_html: HTML of the article page
+            seen_headlines: Normalized headlines already accepted, updated in place
+            seen_content_hashes: Content hashes already accepted, updated in place
+
+        Returns:
+            The extracted article, or None if it is empty, incomplete or a duplicate
+        """
+        if not article_html:
+            return None
+
+        article_data = self.extract_article_content(article_html, article_url)
+
+        # Skip if missing required data
+        if not (article_data["headline"] and article_data["content"]):
+            self._store_scraped_article(
+                article_url,
+                headline=article_data.get("headline"),
+                success=False,
             )
+            return None
 
-            # Clean up old records periodically
-            import random
+        # Deduplicate by headline
+        headline_normalized = article_data["headline"].lower().strip()
+        if headline_normalized in seen_headlines:
+            self.logger.debug(
+                "Skipping duplicate headline: %s", article_data["headline"]
+            )
+            return None
 
-            if random.random() < 0.1:
-                self.cleanup_old_scraped_records()
+        # Deduplicate by content hash
+        content_hash = hash(article_data["content"].lower().strip())
+        if content_hash in seen_content_hashes:
+            self.logger.debug(
+                "Skipping duplicate content for: %s", article_data["headline"]
+            )
+            return None
+
+        # Mark as seen
+        seen_headlines.add(headline_normalized)
+        seen_content_hashes.add(content_hash)
+
+        # Update stored article with extracted content
+        self._store_scraped_article(
+            article_url,
+            headline=article_data["headline"],
+            content=article_data["content"],
+            success=True,
+        )
+        return article_data
 
-            return all_articles
+    def _finish_scrape(self, article_count: int) -> None:
+        """Log the scrape result and occasionally prune old records.
+
+        Args:
+            article_count: Number of unique articles extracted
+        """
+        self.logger.info(
+            f"Extracted {article_count} unique articles after deduplication"
+        )
+
+        # Clean up old records periodically
+        if random.random() < 0.1:
+            self.cleanup_old_scraped_records()
 
     def _is_news_site_url(self, url: str) -> bool:
         """Check if a URL is a main news site URL."""
-        normalized_url = self._normalize_url(url)
-        return any(
-            self._normalize_url(str(news_site)) == normalized_url
-            for news_site in getattr(self.config, "news_sites", [])
-        )
+        return self._normalize_url(url) in self._news_site_set
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for deduplication."""
-        url = url.rstrip("/").lower()
-        fragment_pos = url.find("#")
-        if fragment_pos != -1:
-            url = url[:fragment_pos]
-
-        query_pos = url.find("?")
-        if query_pos != -1:
-            base_url = url[:query_pos]
-            params = url[query_pos + 1 :].lower()
-
-            tracking_prefixes = {"utm_", "fbclid", "gclid"}
-            tracking_substrings = {"ref=", "source="}
-
-            essential_params = [
-                param
-                for param in params.split("&")
-                if not (
-                    any(param.startswith(prefix) for prefix in tracking_prefixes)
-                    or any(substring in param for substring in tracking_substrings)
-                )
-            ]
-
-            if essential_params:
-                url = f"{base_url}?{'&'.join(essential_params)}"
-            else:
-                url = base_url
-
-        return url.lower()
+        return normalize_url(url)
 
     def _hash_string(self, text: str) -> str:
         """Create hash of string for comparison."""
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return hash_string(text)
+
+    def _get_recent_hashes(self) -> set[str]:
+        """Get the URL hashes scraped within the cache window.
+
+        The set is loaded with one query per scraper and kept up to date by
+        _store_scraped_article, which also covers rows still queued for
+        writing, so URL checks during a crawl never open a connection. A
+        scraper lives for a single run, far shorter than the cache window, so
+        entries do not need to expire while it is in use.
+
+        Returns:
+            Set of url_hash values scraped since the cache cutoff
+        """
+        if self._recent_hashes is None:
+            cutoff_time = (
+                datetime.now() - timedelta(hours=int(self.scraping_cache_hours))
+            ).isoformat()
+
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT url_hash FROM scraped_articles WHERE scraped_at > ?",
+                    (cutoff_time,),
+                ).fetchall()
+            self._recent_hashes = {row[0] for row in rows}
+        return self._recent_hashes
 
     def _check_if_recently_scraped(self, url: str) -> bool:
         """Check if URL was recently scraped."""
@@ -672,27 +998,9 @@ class WebsiteScraper:
         normalized_url = self._normalize_url(url)
         url_hash = self._hash_string(normalized_url)
 
-        cutoff_time = (
-            datetime.now() - timedelta(hours=int(self.scraping_cache_hours))
-        ).isoformat()
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT scraped_at, scrape_success
-                FROM scraped_articles
-                WHERE url_hash = ? AND scraped_at > ?
-            """,
-                (url_hash, cutoff_time),
-            )
-
-            result = cursor.fetchone()
-            if result:
-                self.logger.debug(
-                    f"URL recently scraped (at {result[0]}), skipping: {url}"
-                )
-                return True
+        if url_hash in self._get_recent_hashes():
+            self.logger.debug("URL recently scraped, skipping: %s", url)
+            return True
 
         return False
 
@@ -703,34 +1011,57 @@ class WebsiteScraper:
         content: Optional[str] = None,
         success: bool = True,
     ) -> None:
-        """Store scraped article in database."""
+        """Queue a scraped article to be stored in the database.
+
+        Rows are written together by _flush_writes once WRITE_BATCH_SIZE are
+        queued, and when the browser is closed.
+        """
         normalized_url = self._normalize_url(url)
         url_hash = self._hash_string(normalized_url)
 
         content_hash = None
         if content:
-            content_hash = self._hash_string(content[:500].lower().strip())
+            content_hash = self._hash_string(
+                content[:CONTENT_PREVIEW_CHARS].lower().strip()
+            )
+
+        self._pending_writes.append(
+            (
+                url,
+                url_hash,
+                normalized_url,
+                headline,
+                content_hash,
+                datetime.now().isoformat(),
+                success,
+            )
+        )
+        self.logger.debug("Queued scraped article: %.100s", url)
+
+        # Queued rows are not in the database yet, so the set must cover them
+        self._get_recent_hashes().add(url_hash)
+
+        if len(self._pending_writes) >= WRITE_BATCH_SIZE:
+            self._flush_writes()
+
+    def _flush_writes(self) -> None:
+        """Write the queued scraped-article rows in a single transaction."""
+        if not self._pending_writes:
+            return
 
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO scraped_articles
                 (url, url_hash, normalized_url, headline, content_hash, scraped_at, scrape_success)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    url,
-                    url_hash,
-                    normalized_url,
-                    headline,
-                    content_hash,
-                    datetime.now().isoformat(),
-                    success,
-                ),
+                self._pending_writes,
             )
             conn.commit()
-            self.logger.debug(f"Stored scraped article: {url[:100]}")
+
+        self.logger.debug("Stored %d scraped articles", len(self._pending_writes))
+        self._pending_writes.clear()
 
     def cleanup_old_scraped_records(self, days_to_keep: int = 7) -> int:
         """Clean up old scraped article records from database."""
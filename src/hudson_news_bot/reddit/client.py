@@ -9,7 +9,7 @@ import asyncpraw  # type: ignore
 from asyncpraw.exceptions import AsyncPRAWException, RedditAPIException  # type: ignore
 from asyncpraw.models import Submission, Subreddit  # type: ignore
 
-from hudson_news_bot.config.settings import Config
+from hudson_news_bot.config.settings import Config, get_config
 from hudson_news_bot.news.models import NewsItem
 
 
@@ -159,30 +159,38 @@ class RedditClient:
     ) -> list[Submission | None]:
         """Submit multiple news items with rate limiting.
 
+        Submissions start delay_between_posts seconds apart but run
+        concurrently, so a slow request does not push back the ones after it.
+
         Args:
             news_items: List of news items to submit
             dry_run: If True, don't actually submit
-            delay_between_posts: Seconds to wait between submissions
+            delay_between_posts: Seconds between the start of each submission
 
         Returns:
             List of submission objects (None for failed submissions)
         """
-        submissions: list[Submission | None] = []
-
-        for i, news_item in enumerate(news_items):
-            if i > 0 and not dry_run:
+        if not dry_run and news_items:
+            # Connect once up front so concurrent submissions share the session
+            await self._get_subreddit()
+            if len(news_items) > 1:
                 self.logger.info(
-                    f"Waiting {delay_between_posts} seconds before next submission..."
+                    "Spacing submissions %d seconds apart...", delay_between_posts
                 )
-                await asyncio.sleep(delay_between_posts)
 
-            submission = await self.submit_news_item(news_item, dry_run=dry_run)
-            submissions.append(submission)
+        async def submit_in_turn(index: int, news_item: NewsItem) -> Submission | None:
+            if index > 0 and not dry_run:
+                await asyncio.sleep(index * delay_between_posts)
+            return await self.submit_news_item(news_item, dry_run=dry_run)
+
+        submissions: list[Submission | None] = await asyncio.gather(
+            *(submit_in_turn(i, item) for i, item in enumerate(news_items))
+        )
 
         success_count = sum(1 for s in submissions if s is not None)
 
         self.logger.info(
-            f"Submitted {success_count}/{len(news_items)} articles successfully"
+            "Submitted %d/%d articles successfully", success_count, len(news_items)
         )
 
         return submissions
@@ -207,7 +215,7 @@ class RedditClient:
                 async for submission in subreddit.search(query, limit=limit, sort="new")
             ]
             self.logger.debug(
-                f"Found {len(submissions)} submissions for query: {query}"
+                "Found %d submissions for query: %s", len(submissions), query
             )
             return submissions
 
@@ -237,7 +245,7 @@ class RedditClient:
             submissions = [
                 submission async for submission in user.submissions.new(limit=limit)
             ]
-            self.logger.debug(f"Retrieved {len(submissions)} user submissions")
+            self.logger.debug("Retrieved %d user submissions", len(submissions))
             return submissions
 
         except Exception:
@@ -276,7 +284,7 @@ class RedditClient:
                 except (AttributeError, KeyError, TypeError):
                     continue
 
-            self.logger.debug(f"Retrieved {len(flair_options)} flair options")
+            self.logger.debug("Retrieved %d flair options", len(flair_options))
             return flair_options
 
         except Exception:
@@ -327,7 +335,7 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.test_connection:
-        config = Config(args.config)
+        config = get_config(args.config)
         client = RedditClient(config)
         success = asyncio.run(client.test_connection())
         sys.exit(0 if success else 1)
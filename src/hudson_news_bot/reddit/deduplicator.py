@@ -1,18 +1,77 @@
 """Duplicate detection system for Reddit submissions."""
 
+import asyncio
 import hashlib
 import logging
 import sqlite3
 import urllib.parse
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
+from asyncpraw.models import Submission
 
 from hudson_news_bot.config.settings import Config
 from hudson_news_bot.news.models import NewsItem
 from hudson_news_bot.reddit.client import RedditClient
 
+# How long a "not found on Reddit" result is trusted before searching again
+REDDIT_CHECK_TTL: Final = timedelta(hours=1)
+
+
+@lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """Normalize URL for comparison.
+
+    Results are cached because the same links are compared many times per
+    run: every candidate item is checked against the same Reddit listings.
+
+    Args:
+        url: Original URL
+
+    Returns:
+        Normalized URL
+    """
+    # Parse URL
+    parsed = urllib.parse.urlparse(url)
+
+    # Remove common tracking parameters
+    query_params = urllib.parse.parse_qs(parsed.query)
+    filtered_params = {
+        k: v
+        for k, v in query_params.items()
+        if not k.lower().startswith(("utm_", "fb_", "gclid", "ref_", "campaign"))
+    }
+
+    # Rebuild query string
+    new_query = urllib.parse.urlencode(filtered_params, doseq=True)
+
+    # Normalize domain (remove www, ensure lowercase)
+    domain = parsed.netloc.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    # Remove trailing slash from path
+    path = parsed.path.rstrip("/")
+    if not path:
+        path = "/"
+
+    # Rebuild URL
+    normalized = urllib.parse.urlunparse(
+        (
+            parsed.scheme.lower(),
+            domain,
+            path,
+            parsed.params,
+            new_query,
+            "",  # Remove fragment
+        )
+    )
+
+    return normalized
+
 
 class DuplicationChecker:
     """Handles duplicate detection for Reddit submissions."""
@@ -33,6 +92,9 @@ class DuplicationChecker:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
 
+        # In-memory index of stored URL and title hashes, loaded on first use
+        self._known_hashes: set[str] | None = None
+
     def _init_database(self) -> None:
         """Initialize SQLite database for tracking submissions."""
         with sqlite3.connect(self.db_path) as conn:
@@ -53,6 +115,14 @@ class DuplicationChecker:
                 )
             """)
 
+            # Create table caching negative Reddit search results
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reddit_checks (
+                    url_hash TEXT PRIMARY KEY,
+                    checked_at TIMESTAMP NOT NULL
+                )
+            """)
+
             # Create indexes for performance
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_url_hash ON submitted_urls(url_hash)"
@@ -70,6 +140,25 @@ class DuplicationChecker:
             conn.commit()
             self.logger.debug("Database initialized successfully")
 
+    def _get_known_hashes(self) -> set[str]:
+        """Get the set of URL and title hashes stored in the database.
+
+        The set is loaded once and kept up to date by _store_submission, so
+        most local lookups can be answered without opening a connection.
+        Records removed by cleanup_old_records stay in the set; a stale hit
+        only means falling back to the database query.
+
+        Returns:
+            Set of stored url_hash and title_hash values
+        """
+        if self._known_hashes is None:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT url_hash, title_hash FROM submitted_urls"
+                ).fetchall()
+            self._known_hashes = {h for row in rows for h in row}
+        return self._known_hashes
+
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for comparison.
 
@@ -79,43 +168,7 @@ class DuplicationChecker:
         Returns:
             Normalized URL
         """
-        # Parse URL
-        parsed = urllib.parse.urlparse(url)
-
-        # Remove common tracking parameters
-        query_params = urllib.parse.parse_qs(parsed.query)
-        filtered_params = {
-            k: v
-            for k, v in query_params.items()
-            if not k.lower().startswith(("utm_", "fb_", "gclid", "ref_", "campaign"))
-        }
-
-        # Rebuild query string
-        new_query = urllib.parse.urlencode(filtered_params, doseq=True)
-
-        # Normalize domain (remove www, ensure lowercase)
-        domain = parsed.netloc.lower()
-        if domain.startswith("www."):
-            domain = domain[4:]
-
-        # Remove trailing slash from path
-        path = parsed.path.rstrip("/")
-        if not path:
-            path = "/"
-
-        # Rebuild URL
-        normalized = urllib.parse.urlunparse(
-            (
-                parsed.scheme.lower(),
-                domain,
-                path,
-                parsed.params,
-                new_query,
-                "",  # Remove fragment
-            )
-        )
-
-        return normalized
+        return normalize_url(url)
 
     def _hash_string(self, text: str) -> str:
         """Create hash of string for comparison.
@@ -163,11 +216,52 @@ class DuplicationChecker:
 
         return normalized
 
-    async def is_duplicate(self, news_item: NewsItem) -> tuple[bool, str | None]:
+    async def are_duplicates(
+        self, news_items: list[NewsItem]
+    ) -> list[tuple[bool, str | None]]:
+        """Check a batch of news items for duplicates.
+
+        The bot's own recent submissions are fetched at most once for the
+        whole batch, and only if some item reaches the Reddit check; the
+        per-item checks run concurrently.
+
+        Args:
+            news_items: News items to check
+
+        Returns:
+            List of (is_duplicate, reason) tuples in the same order as news_items
+        """
+        if not self.config.check_for_duplicates or not news_items:
+            return [(False, None)] * len(news_items)
+
+        semaphore = asyncio.Semaphore(8)
+        fetch_lock = asyncio.Lock()
+        user_submissions: list[Submission] | None = None
+
+        async def get_user_submissions() -> list[Submission]:
+            nonlocal user_submissions
+            async with fetch_lock:
+                if user_submissions is None:
+                    user_submissions = await self._fetch_user_submissions()
+            return user_submissions
+
+        async def check_with_limit(news_item: NewsItem) -> tuple[bool, str | None]:
+            async with semaphore:
+                return await self.is_duplicate(news_item, get_user_submissions)
+
+        return list(await asyncio.gather(*(check_with_limit(n) for n in news_items)))
+
+    async def is_duplicate(
+        self,
+        news_item: NewsItem,
+        get_user_submissions: Callable[[], Awaitable[list[Submission]]] | None = None,
+    ) -> tuple[bool, str | None]:
         """Check if news item is a duplicate.
 
         Args:
             news_item: News item to check
+            get_user_submissions: Returns the bot's recent submissions; called
+                only if the Reddit check runs. Fetches them if not given
 
         Returns:
             Tuple of (is_duplicate, reason)
@@ -175,22 +269,73 @@ class DuplicationChecker:
         if not self.config.check_for_duplicates:
             return False, None
 
-        self.logger.debug(f"Checking duplicates for: {news_item.headline}")
+        self.logger.debug("Checking duplicates for: %s", news_item.headline)
 
         # Check local database first
         is_dup, reason = self._check_local_database(news_item)
         if is_dup:
             return is_dup, reason
 
+        # Skip the Reddit search if it came up empty recently
+        url_hash = self._hash_string(self._normalize_url(news_item.link))
+        if self._recently_checked(url_hash):
+            self.logger.debug("Using cached Reddit check for: %s", news_item.link)
+            return False, None
+
         # Check Reddit submissions
-        is_dup, reason = await self._check_reddit_submissions(news_item)
+        is_dup, reason = await self._check_reddit_submissions(
+            news_item, get_user_submissions
+        )
         if is_dup:
             # Store in local database for future reference
             self._store_submission(news_item, source="reddit")
             return is_dup, reason
 
+        self._record_reddit_check(url_hash)
         return False, None
 
+    async def _fetch_user_submissions(self) -> list[Submission]:
+        """Fetch the bot's recent submissions.
+
+        Returns:
+            Up to max_search_results of the bot's submissions
+        """
+        return await self.reddit_client.get_user_submissions(
+            limit=self.config.max_search_results
+        )
+
+    def _recently_checked(self, url_hash: str) -> bool:
+        """Check whether Reddit was searched for this URL within the TTL.
+
+        Args:
+            url_hash: Hash of the normalized URL
+
+        Returns:
+            True if a negative Reddit check is still fresh
+        """
+        cutoff = (datetime.now() - REDDIT_CHECK_TTL).isoformat()
+
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM reddit_checks WHERE url_hash = ? AND checked_at > ?",
+                (url_hash, cutoff),
+            ).fetchone()
+
+        return row is not None
+
+    def _record_reddit_check(self, url_hash: str) -> None:
+        """Record that a Reddit search found no duplicate for this URL.
+
+        Args:
+            url_hash: Hash of the normalized URL
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reddit_checks (url_hash, checked_at) VALUES (?, ?)",
+                (url_hash, datetime.now().isoformat()),
+            )
+            conn.commit()
+
     def _check_local_database(self, news_item: NewsItem) -> tuple[bool, str | None]:
         """Check local database for duplicates.
 
@@ -206,6 +351,10 @@ class DuplicationChecker:
         normalized_title = self._normalize_title(news_item.headline)
         title_hash = self._hash_string(normalized_title)
 
+        known_hashes = self._get_known_hashes()
+        if url_hash not in known_hashes and title_hash not in known_hashes:
+            return False, None
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
 
@@ -238,24 +387,30 @@ class DuplicationChecker:
         return False, None
 
     async def _check_reddit_submissions(
-        self, news_item: NewsItem
+        self,
+        news_item: NewsItem,
+        get_user_submissions: Callable[[], Awaitable[list[Submission]]] | None = None,
     ) -> tuple[bool, str | None]:
         """Check Reddit for existing submissions.
 
         Args:
             news_item: News item to check
+            get_user_submissions: Returns the bot's recent submissions;
+                fetches them if not given
 
         Returns:
             Tuple of (is_duplicate, reason)
         """
+        normalized_link = self._normalize_url(news_item.link)
+
         # First check bot's own submissions
-        user_submissions = await self.reddit_client.get_user_submissions(
-            limit=self.config.max_search_results
-        )
+        user_submissions = await (
+            get_user_submissions or self._fetch_user_submissions
+        )()
 
         for submission in user_submissions:
             # Check URL similarity
-            if self._urls_are_similar(news_item.link, submission.url):
+            if self._normalize_url(submission.url) == normalized_link:
                 return (
                     True,
                     f"Already submitted by bot: {submission.url} (ID: {submission.id})",
@@ -282,7 +437,7 @@ class DuplicationChecker:
 
             for submission in submissions:
                 # Check URL similarity
-                if self._urls_are_similar(news_item.link, submission.url):
+                if self._normalize_url(submission.url) == normalized_link:
                     return (
                         True,
                         f"Similar URL found: {submission.url} (ID: {submission.id})",
@@ -298,14 +453,14 @@ class DuplicationChecker:
                 # Check for duplicates using Reddit's built-in feature
                 try:
                     async for duplicate in submission.duplicates():
-                        if self._urls_are_similar(news_item.link, duplicate.url):
+                        if self._normalize_url(duplicate.url) == normalized_link:
                             return (
                                 True,
                                 f"Duplicate URL found via Reddit API: {duplicate.url} (ID: {duplicate.id})",
                             )
                 except Exception as e:
                     self.logger.debug(
-                        f"Error checking duplicates for {submission.id}: {e}"
+                        "Error checking duplicates for %s: %s", submission.id, e
                     )
 
         return False, None
@@ -405,7 +560,10 @@ class DuplicationChecker:
 
             conn.commit()
 
-        self.logger.debug(f"Stored submission: {news_item.headline}")
+        if self._known_hashes is not None:
+            self._known_hashes.update((url_hash, title_hash))
+
+        self.logger.debug("Stored submission: %s", news_item.headline)
 
     def cleanup_old_records(self, days_to_keep: int = 30) -> int:
         """Clean up old records from database.
@@ -426,6 +584,12 @@ class DuplicationChecker:
             )
 
             deleted_count = cursor.rowcount
+
+            # Expired Reddit checks are never read again
+            cursor.execute(
+                "DELETE FROM reddit_checks WHERE checked_at < ?",
+                ((datetime.now() - REDDIT_CHECK_TTL).isoformat(),),
+            )
             conn.commit()
 
         self.logger.info(f"Cleaned up {deleted_count} old records")
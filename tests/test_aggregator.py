@@ -1,16 +1,30 @@
 """Tests for news aggregator."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from hudson_news_bot.config.settings import Config
 from hudson_news_bot.news.aggregator import NewsAggregator, main
+from hudson_news_bot.news.aggregator import test_connection as check_llm_connection
 from hudson_news_bot.news.models import NewsCollection, NewsItem
 from hudson_news_bot.news.scraper import NewsItemDict
 
 
+def stream_articles(articles: list[dict[str, str]]) -> MagicMock:
+    """Create a stand-in for WebsiteScraper.stream_news_sites."""
+
+    async def stream(sites: list[str]) -> AsyncIterator[dict[str, str]]:
+        for article in articles:
+            yield article
+
+    return MagicMock(side_effect=stream)
+
+
 class TestNewsAggregator:
     """Test NewsAggregator class."""
 
@@ -40,6 +54,8 @@ class TestNewsAggregator:
         config.llm_timeout_seconds = 30
         config.llm_model = "test-model"
         config.llm_max_tokens = 4096
+        config.llm_batch_size = 20
+        config.llm_max_concurrency = 4
         config.prompts_dir = temp_prompts_dir
         return config
 
@@ -56,6 +72,14 @@ class TestNewsAggregator:
         assert aggregator.logger.name == "hudson_news_bot.news.aggregator"
         assert aggregator.client is not None
 
+    def test_init_with_invalid_concurrency(self, config: Config) -> None:
+        """Test that a non-positive concurrency is left for validate() to report."""
+        config.llm_max_concurrency = 0  # type: ignore[misc]
+
+        aggregator = NewsAggregator(config)
+
+        assert not aggregator._llm_semaphore.locked()
+
     def test_config_integration(self, temp_prompts_dir: Path) -> None:
         """Test that aggregator properly uses config values."""
         config = MagicMock(spec=Config)
@@ -65,6 +89,8 @@ class TestNewsAggregator:
         config.llm_timeout_seconds = 30
         config.llm_model = "test-model"
         config.llm_max_tokens = 4096
+        config.llm_batch_size = 20
+        config.llm_max_concurrency = 4
         config.prompts_dir = temp_prompts_dir
 
         aggregator = NewsAggregator(config)
@@ -72,6 +98,33 @@ class TestNewsAggregator:
         assert aggregator.config.max_articles == 5
 
 
+class TestConnection:
+    """Test the LLM connection check."""
+
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.news.aggregator.get_config")
+    @patch("hudson_news_bot.news.aggregator.AsyncOpenAI")
+    async def test_connection_reuses_given_client(
+        self, mock_openai_class: MagicMock, mock_get_config: MagicMock
+    ) -> None:
+        """Test that a supplied client is used instead of creating one."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "OK"
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        config = MagicMock()
+        config.llm_model = "test-model"
+
+        assert await check_llm_connection(client, config) is True
+
+        client.chat.completions.create.assert_awaited_once()
+        assert client.chat.completions.create.await_args.kwargs["model"] == "test-model"
+        mock_openai_class.assert_not_called()
+        mock_get_config.assert_not_called()
+
+
 class TestMainCLI:
     """Test the main CLI function."""
 
@@ -152,6 +205,8 @@ class TestAggregateNews:
         config.llm_timeout_seconds = 30
         config.llm_model = "test-model"
         config.llm_max_tokens = 4096
+        config.llm_batch_size = 20
+        config.llm_max_concurrency = 4
         config.prompts_dir = temp_prompts_dir
         return config
 
@@ -209,14 +264,16 @@ class TestAggregateNews:
         # Mock scraper
         mock_scraper_instance = AsyncMock()
         mock_scraper_class.return_value = mock_scraper_instance
-        mock_scraper_instance.scrape_news_sites.return_value = [
-            {
-                "url": "https://hudson.com/article1",
-                "headline": "Test Article",
-                "date": "2025-08-14",
-                "content": "Test content",
-            }
-        ]
+        mock_scraper_instance.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": "https://hudson.com/article1",
+                    "headline": "Test Article",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+            ]
+        )
 
         # Mock OpenAI client
         mock_response = MagicMock()
@@ -234,6 +291,7 @@ class TestAggregateNews:
         assert call_args[1]["model"] == "test-model"
         assert call_args[1]["max_tokens"] == 4096
         assert len(call_args[1]["messages"]) == 2
+        assert call_args[1]["messages"][0] is aggregator._system_message
         assert "Test Article" in call_args[1]["messages"][1]["content"]
 
         assert len(result) == 2
@@ -243,22 +301,227 @@ class TestAggregateNews:
 
     @pytest.mark.asyncio
     @patch("hudson_news_bot.news.aggregator.WebsiteScraper")
-    async def test_aggregate_news_no_response(
+    async def test_aggregate_news_in_batches(
         self,
         mock_scraper_class: MagicMock,
         aggregator: NewsAggregator,
+        config: Config,
     ) -> None:
-        # Mock scraper
+        config.llm_batch_size = 1  # type: ignore[misc]
         mock_scraper_instance = AsyncMock()
         mock_scraper_class.return_value = mock_scraper_instance
-        mock_scraper_instance.scrape_news_sites.return_value = [
-            {
+        mock_scraper_instance.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": f"https://hudson.com/article{i}",
+                    "headline": f"Test Article {i}",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+                for i in (1, 2)
+            ]
+        )
+
+        def respond(**kwargs: object) -> MagicMock:
+            messages = kwargs["messages"]
+            assert isinstance(messages, list)
+            index = 1 if "Test Article 1" in messages[1]["content"] else 2
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = (
+                f'{{"news": [{{"headline": "Story {index}", "summary": "Summary", '
+                f'"publication_date": "2025-08-14", '
+                f'"link": "https://hudson.com/article{index}"}}]}}'
+            )
+            return response
+
+        aggregator.client.chat.completions.create = AsyncMock(side_effect=respond)
+
+        result = await aggregator.aggregate_news()
+
+        assert aggregator.client.chat.completions.create.await_count == 2
+        assert [item.headline for item in result] == ["Story 1", "Story 2"]
+
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.news.aggregator.WebsiteScraper")
+    async def test_aggregate_news_dedupes_across_batches(
+        self, mock_scraper_class: MagicMock, config: Config, aggregator: NewsAggregator
+    ) -> None:
+        config.llm_batch_size = 1  # type: ignore[misc]
+        mock_scraper_class.return_value.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": f"https://site{i}.com/story",
+                    "headline": "Road Closure",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+                for i in (1, 2)
+            ]
+        )
+
+        def respond(**kwargs: object) -> MagicMock:
+            messages = kwargs["messages"]
+            assert isinstance(messages, list)
+            site = 1 if "site1.com" in messages[1]["content"] else 2
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = (
+                f'{{"news": [{{"headline": "Road closure ", "summary": "Summary", '
+                f'"publication_date": "2025-08-14", '
+                f'"link": "https://site{site}.com/story"}}]}}'
+            )
+            return response
+
+        aggregator.client.chat.completions.create = AsyncMock(side_effect=respond)
+
+        result = await aggregator.aggregate_news()
+
+        assert aggregator.client.chat.completions.create.await_count == 2
+        assert len(result) == 1
+
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.news.aggregator.WebsiteScraper")
+    async def test_aggregate_news_limits_concurrency(
+        self, mock_scraper_class: MagicMock, config: Config
+    ) -> None:
+        config.llm_batch_size = 1  # type: ignore[misc]
+        config.llm_max_concurrency = 2  # type: ignore[misc]
+        aggregator = NewsAggregator(config)
+        mock_scraper_class.return_value.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": f"https://hudson.com/article{i}",
+                    "headline": f"Test Article {i}",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+                for i in range(5)
+            ]
+        )
+        in_flight = 0
+        peak = 0
+
+        async def respond(**kwargs: object) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = '{"news": []}'
+            return response
+
+        aggregator.client.chat.completions.create = AsyncMock(side_effect=respond)
+
+        await aggregator.aggregate_news()
+
+        assert aggregator.client.chat.completions.create.await_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.news.aggregator.WebsiteScraper")
+    async def test_aggregate_news_analyzes_while_scraping(
+        self,
+        mock_scraper_class: MagicMock,
+        aggregator: NewsAggregator,
+        config: Config,
+    ) -> None:
+        config.llm_batch_size = 1  # type: ignore[misc]
+        first_batch_sent = asyncio.Event()
+
+        async def stream(sites: list[str]) -> AsyncIterator[dict[str, str]]:
+            for i in (1, 2):
+                yield {
+                    "url": f"https://hudson.com/article{i}",
+                    "headline": f"Test Article {i}",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+                # The next page only "finishes loading" once analysis started
+                await asyncio.wait_for(first_batch_sent.wait(), timeout=1)
+
+        mock_scraper_class.return_value.stream_news_sites = MagicMock(
+            side_effect=stream
+        )
+
+        def respond(**kwargs: object) -> MagicMock:
+            first_batch_sent.set()
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = '{"news": []}'
+            return response
+
+        aggregator.client.chat.completions.create = AsyncMock(side_effect=respond)
+
+        await aggregator.aggregate_news()
+
+        assert aggregator.client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.news.aggregator.WebsiteScraper")
+    async def test_aggregate_news_fetches_flair_while_scraping(
+        self, mock_scraper_class: MagicMock, config: Config
+    ) -> None:
+        scraping_started = asyncio.Event()
+
+        async def stream(sites: list[str]) -> AsyncIterator[dict[str, str]]:
+            scraping_started.set()
+            yield {
                 "url": "https://hudson.com/article1",
                 "headline": "Test Article",
                 "date": "2025-08-14",
                 "content": "Test content",
             }
-        ]
+
+        async def get_flair_options() -> dict[str, str]:
+            # Only completes if scraping runs while flair is being fetched
+            await asyncio.wait_for(scraping_started.wait(), timeout=1)
+            return {"Local News": "flair-template-123"}
+
+        reddit_client = MagicMock()
+        reddit_client.get_flair_options = AsyncMock(side_effect=get_flair_options)
+        aggregator = NewsAggregator(config, reddit_client)
+        mock_scraper_class.return_value.stream_news_sites = MagicMock(
+            side_effect=stream
+        )
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = (
+            '{"news": [{"headline": "Story", "summary": "Summary", '
+            '"publication_date": "2025-08-14", '
+            '"link": "https://hudson.com/article1", "flair": "Local News"}]}'
+        )
+        aggregator.client.chat.completions.create = AsyncMock(
+            return_value=mock_response
+        )
+
+        result = await aggregator.aggregate_news()
+
+        assert result.news[0].flair_id == "flair-template-123"
+
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.news.aggregator.WebsiteScraper")
+    async def test_aggregate_news_no_response(
+        self,
+        mock_scraper_class: MagicMock,
+        aggregator: NewsAggregator,
+    ) -> None:
+        # Mock scraper
+        mock_scraper_instance = AsyncMock()
+        mock_scraper_class.return_value = mock_scraper_instance
+        mock_scraper_instance.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": "https://hudson.com/article1",
+                    "headline": "Test Article",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+            ]
+        )
 
         # Mock OpenAI client with no content in response
         mock_response = MagicMock()
@@ -282,14 +545,16 @@ class TestAggregateNews:
         # Mock scraper
         mock_scraper_instance = AsyncMock()
         mock_scraper_class.return_value = mock_scraper_instance
-        mock_scraper_instance.scrape_news_sites.return_value = [
-            {
-                "url": "https://hudson.com/article1",
-                "headline": "Test Article",
-                "date": "2025-08-14",
-                "content": "Test content",
-            }
-        ]
+        mock_scraper_instance.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": "https://hudson.com/article1",
+                    "headline": "Test Article",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+            ]
+        )
 
         # Mock OpenAI client with invalid JSON (incomplete)
         mock_response = MagicMock()
@@ -313,14 +578,16 @@ class TestAggregateNews:
         # Mock scraper
         mock_scraper_instance = AsyncMock()
         mock_scraper_class.return_value = mock_scraper_instance
-        mock_scraper_instance.scrape_news_sites.return_value = [
-            {
-                "url": "https://hudson.com/article1",
-                "headline": "Test Article",
-                "date": "2025-08-14",
-                "content": "Test content",
-            }
-        ]
+        mock_scraper_instance.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": "https://hudson.com/article1",
+                    "headline": "Test Article",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+            ]
+        )
 
         # Set up flair mapping
         aggregator.flair_mapping = {"Local News": "flair-template-123"}
@@ -359,14 +626,16 @@ class TestAggregateNews:
         # Mock scraper
         mock_scraper_instance = AsyncMock()
         mock_scraper_class.return_value = mock_scraper_instance
-        mock_scraper_instance.scrape_news_sites.return_value = [
-            {
-                "url": "https://hudson.com/article1",
-                "headline": "Test Article",
-                "date": "2025-08-14",
-                "content": "Test content",
-            }
-        ]
+        mock_scraper_instance.stream_news_sites = stream_articles(
+            [
+                {
+                    "url": "https://hudson.com/article1",
+                    "headline": "Test Article",
+                    "date": "2025-08-14",
+                    "content": "Test content",
+                }
+            ]
+        )
 
         # Mock OpenAI client with empty news array (valid JSON, no results)
         json_response = '{"news": []}'
@@ -395,6 +664,7 @@ class TestTemplateLoading:
 
         assert aggregator._system_template is not None
         assert aggregator._analysis_template is not None
+        assert aggregator._system_prompt == aggregator._system_template.render()
 
     def test_missing_template_raises_error(self, tmp_path: Path) -> None:
         """Test that missing templates raise ValueError."""
@@ -540,6 +810,8 @@ class TestResponseParsing:
         config.llm_timeout_seconds = 30
         config.llm_model = "test-model"
         config.llm_max_tokens = 4096
+        config.llm_batch_size = 20
+        config.llm_max_concurrency = 4
         config.prompts_dir = temp_prompts_dir
         return NewsAggregator(config)
 
@@ -5,7 +5,14 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from hudson_news_bot.config.settings import Config
+import pytest
+
+from hudson_news_bot.config.settings import (
+    DEFAULT_CONFIG,
+    Config,
+    deep_merge_dicts,
+    get_config,
+)
 
 
 class TestConfig:
@@ -81,6 +88,44 @@ system_prompt = "Test prompt"
             finally:
                 Path(f.name).unlink()
 
+    def test_config_missing_file_uses_defaults(self, tmp_path: Path) -> None:
+        """Test that a missing configuration file falls back to defaults."""
+        config = Config(tmp_path / "missing.toml")
+
+        assert config.max_articles == DEFAULT_CONFIG["news"]["max_articles"]
+        assert config.subreddit_name == DEFAULT_CONFIG["reddit"]["subreddit"]
+
+        _, errors = config.validate()
+        assert any("Configuration file not found" in error for error in errors)
+
+        # Returned lists must not alias the shared defaults
+        config.news_sites.append("https://example.com")
+        assert "https://example.com" not in DEFAULT_CONFIG["news"]["news_sites"]
+
+    def test_get_config_returns_shared_instance(self, tmp_path: Path) -> None:
+        """Test that get_config caches one instance per resolved path."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("[news]\nmax_articles = 3\n")
+
+        config = get_config(config_file)
+
+        assert config.max_articles == 3
+        assert get_config(str(config_file)) is config
+        assert get_config(tmp_path / "other.toml") is not config
+
+    def test_config_is_read_only(self, tmp_path: Path) -> None:
+        """Test that a loaded config rejects attribute changes."""
+        config = Config(tmp_path / "missing.toml")
+
+        with pytest.raises(AttributeError):
+            config.max_articles = 1  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            del config.max_articles
+
+        assert config.max_articles == DEFAULT_CONFIG["news"]["max_articles"]
+        # Lazily resolved values are still cached
+        assert config.prompts_dir is config.prompts_dir
+
     @patch.dict(
         os.environ,
         {
@@ -243,3 +288,27 @@ max_articles = 0
                 )
             finally:
                 Path(f.name).unlink()
+
+    def test_validation_uses_coerced_values(self, tmp_path: Path) -> None:
+        """Test that rules check the typed attributes, not the raw TOML values."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(
+            '[news]\nmax_articles = "5"\n\n[llm]\nbatch_size = "0"\n'
+        )
+
+        _, errors = Config(config_file).validate()
+
+        assert not any("max_articles" in error for error in errors)
+        assert "llm batch_size must be greater than 0" in errors
+
+
+def test_deep_merge_dicts_nested() -> None:
+    """Test nested merging without mutating either input."""
+    base = {"a": {"b": {"c": 1, "d": 2}}, "sites": ["x"]}
+    overrides = {"a": {"b": {"c": 3}, "e": 4}, "sites": ["y"]}
+
+    result = deep_merge_dicts(base, overrides)
+
+    assert result == {"a": {"b": {"c": 3, "d": 2}, "e": 4}, "sites": ["y"]}
+    assert base == {"a": {"b": {"c": 1, "d": 2}}, "sites": ["x"]}
+    assert result["sites"] is not overrides["sites"]
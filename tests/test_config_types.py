@@ -2,6 +2,8 @@
 
 from typing import get_type_hints
 
+import pytest
+
 from hudson_news_bot.config.settings import (
     ConfigDict,
     NewsConfig,
@@ -94,7 +96,7 @@ def test_default_config_matches_typeddict():
     assert "skip_recently_scraped" in DEFAULT_CONFIG["news"]
     assert "scraping_cache_hours" in DEFAULT_CONFIG["news"]
     assert isinstance(DEFAULT_CONFIG["news"]["max_articles"], int)
-    assert isinstance(DEFAULT_CONFIG["news"]["news_sites"], list)
+    assert isinstance(DEFAULT_CONFIG["news"]["news_sites"], tuple)
     assert isinstance(DEFAULT_CONFIG["news"]["skip_recently_scraped"], bool)
     assert isinstance(DEFAULT_CONFIG["news"]["scraping_cache_hours"], int)
 
@@ -121,3 +123,9 @@ def test_default_config_matches_typeddict():
     # Check database config
     assert "path" in DEFAULT_CONFIG["database"]
     assert isinstance(DEFAULT_CONFIG["database"]["path"], str)
+
+
+def test_default_config_is_immutable():
+    """Test that DEFAULT_CONFIG cannot be modified through shared references."""
+    with pytest.raises(TypeError):
+        DEFAULT_CONFIG["news"]["max_articles"] = 10  # type: ignore[index]
@@ -3,7 +3,7 @@
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -118,6 +118,22 @@ class TestDuplicationChecker:
         assert "URL already submitted" in reason
         assert "test123" in reason
 
+    def test_local_check_uses_hashes_from_existing_database(self) -> None:
+        """Test that records stored by another instance are still found."""
+        news_item = NewsItem(
+            headline="Test News Story",
+            summary="This is a test news story",
+            publication_date=datetime(2025, 8, 12),
+            link="https://example.com/news",
+        )
+        self.checker.store_submission(news_item, "test123")
+
+        checker = DuplicationChecker(self.mock_reddit_client, self.mock_config)
+        is_dup, reason = checker._check_local_database(news_item)
+        assert is_dup
+        assert reason is not None
+        assert "test123" in reason
+
     @pytest.mark.asyncio
     async def test_check_duplicates_disabled(self) -> None:
         """Test that duplicate checking can be disabled."""
@@ -134,6 +150,73 @@ class TestDuplicationChecker:
         assert not is_dup
         assert reason is None
 
+    @pytest.mark.asyncio
+    async def test_negative_reddit_check_is_cached(self) -> None:
+        """Test that a clean Reddit search is not repeated within the TTL."""
+        news_item = NewsItem(
+            headline="Test News Story",
+            summary="This is a test",
+            publication_date=datetime(2025, 8, 12),
+            link="https://example.com/news",
+        )
+        self.mock_reddit_client.get_user_submissions = AsyncMock(return_value=[])
+        self.mock_reddit_client.search_submissions = AsyncMock(return_value=[])
+
+        assert await self.checker.is_duplicate(news_item) == (False, None)
+        assert await self.checker.is_duplicate(news_item) == (False, None)
+
+        self.mock_reddit_client.get_user_submissions.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_are_duplicates_fetches_user_submissions_once(self) -> None:
+        """Test that a batch check shares one user submissions fetch."""
+        stored = NewsItem(
+            headline="Stored News Story",
+            summary="This is a test",
+            publication_date=datetime(2025, 8, 12),
+            link="https://example.com/stored",
+        )
+        fresh = NewsItem(
+            headline="Fresh News Story",
+            summary="This is a test",
+            publication_date=datetime(2025, 8, 12),
+            link="https://example.com/fresh",
+        )
+        self.checker.store_submission(stored, "test123")
+        self.mock_reddit_client.get_user_submissions = AsyncMock(return_value=[])
+        self.mock_reddit_client.search_submissions = AsyncMock(return_value=[])
+
+        results = await self.checker.are_duplicates([stored, fresh, fresh])
+
+        assert [is_dup for is_dup, _ in results] == [True, False, False]
+        self.mock_reddit_client.get_user_submissions.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_are_duplicates_skips_reddit_when_answered_locally(self) -> None:
+        """Test that user submissions are not fetched if no item needs Reddit."""
+        stored = NewsItem(
+            headline="Stored News Story",
+            summary="This is a test",
+            publication_date=datetime(2025, 8, 12),
+            link="https://example.com/stored",
+        )
+        checked = NewsItem(
+            headline="Checked News Story",
+            summary="This is a test",
+            publication_date=datetime(2025, 8, 12),
+            link="https://example.com/checked",
+        )
+        self.checker.store_submission(stored, "test123")
+        self.checker._record_reddit_check(
+            self.checker._hash_string(self.checker._normalize_url(checked.link))
+        )
+        self.mock_reddit_client.get_user_submissions = AsyncMock(return_value=[])
+
+        results = await self.checker.are_duplicates([stored, checked])
+
+        assert [is_dup for is_dup, _ in results] == [True, False]
+        self.mock_reddit_client.get_user_submissions.assert_not_awaited()
+
     def test_cleanup_old_records(self) -> None:
         """Test cleaning up old database records."""
         # Store some test items
@@ -21,6 +21,7 @@ class TestNewsItem:
         assert item.summary == "Test summary content"
         assert item.publication_date == datetime(2025, 8, 12)
         assert item.link == "https://example.com/news"
+        assert not hasattr(item, "__dict__")
 
     def test_to_toml_dict(self) -> None:
         """Test TOML dictionary conversion."""
@@ -70,6 +71,7 @@ class TestNewsCollection:
 
         assert len(collection) == 2
         assert list(collection) == items
+        assert collection.news is items
 
     def test_to_toml_string(self) -> None:
         """Test TOML string conversion."""
@@ -120,6 +120,31 @@ class TestRedditClient:
         assert all(r is None for r in results)
         assert mock_submit.call_count == 2
 
+    @pytest.mark.asyncio
+    @patch("hudson_news_bot.reddit.client.asyncio.sleep", new_callable=AsyncMock)
+    @patch.object(RedditClient, "_get_subreddit")
+    @patch.object(RedditClient, "submit_news_item")
+    async def test_submit_multiple_news_items_staggered(
+        self,
+        mock_submit: AsyncMock,
+        mock_get_subreddit: AsyncMock,
+        mock_sleep: AsyncMock,
+    ) -> None:
+        """Test that submissions are spaced by start time and keep order."""
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+        mock_submit.side_effect = [first, second, third]
+
+        news_items = [self.test_news_item] * 3
+        client = RedditClient(self.mock_config)
+
+        results = await client.submit_multiple_news_items(
+            news_items, delay_between_posts=10
+        )
+
+        assert results == [first, second, third]
+        mock_get_subreddit.assert_awaited_once()
+        assert [c.args for c in mock_sleep.await_args_list] == [(10,), (20,)]
+
     @pytest.mark.asyncio
     @patch.object(RedditClient, "_get_subreddit")
     async def test_search_submissions_success(
@@ -4,8 +4,16 @@ import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from bs4 import BeautifulSoup
+from playwright.async_api import Error as PlaywrightError
+
 from hudson_news_bot.config.settings import Config
-from hudson_news_bot.news.scraper import WebsiteScraper
+from hudson_news_bot.news.scraper import (
+    CONTEXT_ROTATE_PAGES,
+    STRIP_UNUSED_ELEMENTS_JS,
+    WebsiteScraper,
+    leading_text,
+)
 
 
 @pytest.fixture
@@ -48,11 +56,33 @@ class TestWebsiteScraper:
         assert "https://example.com/article/breaking-news" in links
         assert "https://example.com/story/latest" in links
 
+    def test_extract_article_links_excludes_listing_pages(self, scraper):
+        """Test that category, tag, pagination and anchor links are skipped."""
+        html = """
+        <html>
+            <a href="/news/local-story">Local Story</a>
+            <a href="/news/national/other-story">National Story</a>
+            <a href="/news/page/2">Older News</a>
+            <a href="/category/news/">News Category</a>
+            <a href="/story/latest#comments">Comments</a>
+        </html>
+        """
+
+        links = scraper.extract_article_links(html, "https://example.com")
+
+        assert links == ["https://example.com/news/local-story"]
+
     def test_extract_article_links_empty_html(self, scraper):
         """Test extracting links from empty HTML."""
         links = scraper.extract_article_links("", "https://example.com")
         assert links == []
 
+    def test_is_news_site_url(self, scraper):
+        """Test listing pages are matched after normalization."""
+        assert scraper._is_news_site_url("https://EXAMPLE.com/")
+        assert scraper._is_news_site_url("https://example.com?utm_source=feed")
+        assert not scraper._is_news_site_url("https://example.com/article/story")
+
     def test_extract_article_content(self, scraper):
         """Test extracting article content from HTML."""
         html = """
@@ -77,6 +107,32 @@ class TestWebsiteScraper:
         assert "Second paragraph" in content["content"]
         assert content["url"] == url
 
+    def test_extract_article_content_date_from_text(self, scraper):
+        """Test that the earliest date-like text is used without structured dates."""
+        html = """
+        <html>
+            <article>
+                <h1>Headline</h1>
+                <p>Posted Jan 15, 2024 by staff.</p>
+                <p>Updated 2024-01-16 with new details.</p>
+            </article>
+        </html>
+        """
+
+        content = scraper.extract_article_content(html, "https://example.com/a")
+
+        assert content["date"] == "Jan 15, 2024"
+
+    def test_leading_text_stops_at_limit(self):
+        """Test that leading text matches a prefix of the full document text."""
+        soup = BeautifulSoup(
+            "<p>Posted</p><p> Jan 15, 2024</p>" + "<p>filler</p>" * 100,
+            "html.parser",
+        )
+
+        assert leading_text(soup, 20) == soup.get_text()[:20]
+        assert leading_text(soup, 10_000) == soup.get_text()
+
     def test_extract_article_content_empty_html(self, scraper):
         """Test extracting content from empty HTML."""
         content = scraper.extract_article_content("", "https://example.com")
@@ -104,6 +160,43 @@ class TestWebsiteScraper:
 
         assert url == "https://example.com"
         assert html == "<html>Test HTML</html>"
+        mock_page.evaluate.assert_awaited_once_with(STRIP_UNUSED_ELEMENTS_JS)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("resource_type", "blocked"),
+        [("image", True), ("stylesheet", True), ("document", False), ("script", False)],
+    )
+    async def test_block_assets(self, scraper, resource_type, blocked):
+        """Test that only assets unused by text extraction are aborted."""
+        route = AsyncMock()
+        route.request.resource_type = resource_type
+
+        await scraper._block_assets(route)
+
+        assert route.abort.await_count == (1 if blocked else 0)
+        assert route.continue_.await_count == (0 if blocked else 1)
+
+    @pytest.mark.asyncio
+    async def test_context_rotates_after_page_limit(self, scraper):
+        """Test that the context is replaced and closed once its pages finish."""
+        old_context = AsyncMock()
+        new_context = AsyncMock()
+        scraper.browser = AsyncMock()
+        scraper.browser.new_context.return_value = new_context
+        scraper.browser_context = old_context
+        scraper._context_pages = CONTEXT_ROTATE_PAGES - 1
+
+        # The last page allowed in the old context is still open
+        held_context = await scraper._acquire_context()
+        assert held_context is old_context
+
+        assert await scraper._acquire_context() is new_context
+        new_context.route.assert_awaited_once()
+        old_context.close.assert_not_awaited()
+
+        await scraper._release_context(held_context)
+        old_context.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_fetch_website_failure(self, scraper):
@@ -118,6 +211,26 @@ class TestWebsiteScraper:
         assert url == "https://example.com"
         assert html == ""
 
+    @pytest.mark.asyncio
+    async def test_iter_websites_skips_failed_fetches(self, scraper):
+        """Test that a Playwright error drops only the page that raised it."""
+        scraper.config.max_concurrent_fetches = 2
+
+        async def fetch(url):
+            if url.endswith("/bad"):
+                raise PlaywrightError("Target closed")
+            return url, "<html></html>"
+
+        with patch.object(scraper, "fetch_website", side_effect=fetch):
+            results = [
+                result
+                async for result in scraper._iter_websites(
+                    ["https://example.com/good", "https://example.com/bad"]
+                )
+            ]
+
+        assert results == [("https://example.com/good", "<html></html>")]
+
     @pytest.mark.asyncio
     async def test_scrape_news_sites(self, scraper):
         """Test scraping multiple news sites."""
@@ -1,5 +1,6 @@
 """Tests for the scraper URL caching functionality."""
 
+import hashlib
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -8,7 +9,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from hudson_news_bot.config.settings import Config
-from hudson_news_bot.news.scraper import WebsiteScraper
+from hudson_news_bot.news.scraper import (
+    WRITE_BATCH_SIZE,
+    WebsiteScraper,
+    normalize_url,
+)
 
 
 @pytest.fixture
@@ -54,6 +59,7 @@ class TestScraperCache:
         content = "This is test content for the article."
 
         scraper._store_scraped_article(url, headline, content, success=True)
+        scraper._flush_writes()
 
         # Verify the article was stored
         with sqlite3.connect(scraper.db_path) as conn:
@@ -66,6 +72,23 @@ class TestScraperCache:
             assert result[4] == headline  # headline
             assert result[7] == 1  # scrape_success
 
+    def test_store_scraped_articles_in_batches(self, scraper: WebsiteScraper) -> None:
+        """Test that stored articles are written once a full batch is queued."""
+
+        def count_rows() -> int:
+            with sqlite3.connect(scraper.db_path) as conn:
+                return conn.execute("SELECT COUNT(*) FROM scraped_articles").fetchone()[
+                    0
+                ]
+
+        for i in range(WRITE_BATCH_SIZE - 1):
+            scraper._store_scraped_article(f"https://example.com/batch{i}")
+        assert count_rows() == 0
+
+        scraper._store_scraped_article("https://example.com/batch-last")
+        assert count_rows() == WRITE_BATCH_SIZE
+        assert scraper._pending_writes == []
+
     def test_check_if_recently_scraped(self, scraper: WebsiteScraper) -> None:
         """Test checking if a URL was recently scraped."""
         url = "https://example.com/article2"
@@ -79,6 +102,18 @@ class TestScraperCache:
         # Now it should be marked as recently scraped
         assert scraper._check_if_recently_scraped(url)
 
+    def test_recent_urls_loaded_once(self, scraper: WebsiteScraper) -> None:
+        """Test that URL checks reuse the hashes loaded by the first check."""
+        url = "https://example.com/article5"
+        scraper._store_scraped_article(url, "Test", "Content", success=True)
+        assert scraper._check_if_recently_scraped(url)
+
+        with patch(
+            "hudson_news_bot.news.scraper.sqlite3.connect", side_effect=AssertionError
+        ):
+            assert scraper._check_if_recently_scraped(url)
+            assert not scraper._check_if_recently_scraped("https://example.com/other")
+
     def test_check_if_recently_scraped_expired(self, scraper: WebsiteScraper) -> None:
         """Test that old scraped URLs are not considered recent."""
         url = "https://example.com/article3"
@@ -138,6 +173,18 @@ class TestScraperCache:
         normalized4 = scraper._normalize_url(url4)
         assert normalized4 == normalized4.lower()
 
+    def test_normalize_url_is_cached(self, scraper: WebsiteScraper) -> None:
+        """Test repeated URLs are normalized once per process."""
+        normalize_url.cache_clear()
+        url = "https://example.com/article?utm_source=test&id=123"
+
+        first = scraper._normalize_url(url)
+        second = scraper._normalize_url(url)
+
+        assert first == second
+        assert normalize_url.cache_info().hits == 1
+        assert normalize_url.cache_info().misses == 1
+
     def test_cleanup_old_scraped_records(self, scraper: WebsiteScraper) -> None:
         """Test cleanup of old scraped records."""
         # Insert some old and new records
@@ -230,5 +277,67 @@ class TestScraperCache:
         hash3 = scraper._hash_string("different content")
         assert hash1 != hash3
 
-        # Hash should be 64 characters (SHA-256 hex)
-        assert len(hash1) == 64
+        # Hash should be 32 characters (16-byte BLAKE2b hex)
+        assert len(hash1) == 32
+
+    def test_migrates_sha256_url_hashes(self, mock_config: MagicMock) -> None:
+        """Test that rows keyed by SHA-256 URL hashes are re-keyed on startup."""
+        normalized_url = "https://example.com/legacy"
+        WebsiteScraper(mock_config)
+        with sqlite3.connect(mock_config.database_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO scraped_articles
+                (url, url_hash, normalized_url, scraped_at, scrape_success)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    normalized_url,
+                    hashlib.sha256(normalized_url.encode("utf-8")).hexdigest(),
+                    normalized_url,
+                    datetime.now().isoformat(),
+                    1,
+                ),
+            )
+
+        scraper = WebsiteScraper(mock_config)
+
+        assert scraper._check_if_recently_scraped(normalized_url)
+
+    def test_migration_keeps_existing_new_hash_row(
+        self, mock_config: MagicMock
+    ) -> None:
+        """Test that a URL stored under both hash formats migrates cleanly."""
+        normalized_url = "https://example.com/legacy"
+        scraper = WebsiteScraper(mock_config)
+        with sqlite3.connect(mock_config.database_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO scraped_articles
+                (url, url_hash, normalized_url, scraped_at, scrape_success)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        normalized_url,
+                        url_hash,
+                        normalized_url,
+                        datetime.now().isoformat(),
+                        1,
+                    )
+                    for url_hash in (
+                        hashlib.sha256(normalized_url.encode("utf-8")).hexdigest(),
+                        scraper._hash_string(normalized_url),
+                    )
+                ],
+            )
+
+        scraper = WebsiteScraper(mock_config)
+
+        with sqlite3.connect(mock_config.database_path) as conn:
+            rows = conn.execute(
+                "SELECT url_hash FROM scraped_articles WHERE normalized_url = ?",
+                (normalized_url,),
+            ).fetchall()
+        assert rows == [(scraper._hash_string(normalized_url),)]
+        assert scraper._check_if_recently_scraped(normalized_url)